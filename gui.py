@@ -2,29 +2,96 @@
 Main GUI Window - PyQt6 Interface
 Handles all visual components and user interaction
 """
+import logging
 import sys
-from datetime import datetime
-from typing import Dict, List
+import time
+from typing import List
 
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                            QGroupBox, QPushButton, QLabel, QSlider, 
+                            QGroupBox, QPushButton, QLabel, 
                             QTextEdit, QProgressBar, QComboBox, QSpinBox,
+                            QCheckBox,
                             QScrollArea, QGridLayout, QFrame, QSplitter)
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot, QSize
-from PyQt6.QtGui import QFont, QColor, QPalette, QPainter, QBrush, QPen, QLinearGradient
+from PyQt6.QtGui import (QFont, QColor, QPalette, QPainter, QBrush, QPen, QLinearGradient,
+                        QTextCursor, QPixmapCache)
 
-from simulation import SimulationManager
+from simulation import (SimulationManager, LOG_DEBUG, LOG_INFO, LOG_WARNING,
+                        LOG_ERROR)
 from visuals import ThreadVisualizer, ResourceVisualizer
 
 
+# Pre-rendered HTML prefix for each log level
+_LEVEL_HTML = {
+    LOG_ERROR: '<span style="color: #f44336;">[ERROR]</span>',
+    LOG_WARNING: '<span style="color: #ff9800;">[WARN]</span>',
+    LOG_DEBUG: '<span style="color: #9c27b0;">[DEBUG]</span>',
+    LOG_INFO: '<span style="color: #4CAF50;">[INFO]</span>',
+}
+_LOG_TEMPLATE = '<span style="color: #888;">[%s]</span> %s %s'
+
+# Shared stylesheets for the statistics labels
+_GREEN_SS = "color: #4CAF50;"
+_AMBER_SS = "color: #FFC107;"
+_RED_SS = "color: #f44336;"
+_CONFLICT_SS = "color: #ff5722;"
+
+# Control buttons are styled from one stylesheet on the central widget,
+# matched by object name
+_BUTTONS_QSS = """
+    QPushButton#start, QPushButton#pause, QPushButton#stop, QPushButton#reset {
+        color: white;
+        font-weight: bold;
+        padding: 8px;
+        border-radius: 4px;
+    }
+    QPushButton#start { background-color: #4CAF50; }
+    QPushButton#start:hover { background-color: #45a049; }
+    QPushButton#pause { background-color: #FF9800; }
+    QPushButton#pause:hover { background-color: #e68a00; }
+    QPushButton#stop { background-color: #f44336; }
+    QPushButton#stop:hover { background-color: #da190b; }
+    QPushButton#reset { background-color: #2196F3; }
+    QPushButton#reset:hover { background-color: #0b7dda; }
+"""
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    # Number of lines kept in the event log; older lines are discarded
+    MAX_LOG_BLOCKS = 2000
+    
+    # How often the cached local midnight is recomputed for log timestamps
+    MIDNIGHT_REFRESH_NS = 60_000_000_000
+    
     def __init__(self):
         super().__init__()
         self.simulation = None
         self.thread_visualizer = None
         self.resource_visualizer = None
+        
+        # Latest stats from the simulation, applied on the next refresh tick
+        self._pending_stats = None
+        # Values currently shown by the stats labels (all start at "0")
+        self._rendered_stats: List[int] = [0] * 7
+        
+        # Formatted log entries waiting to be written to the log view
+        self._log_buffer: List[str] = []
+        self._last_log_key = None
+        
+        # Local midnight in epoch nanoseconds, used to format log timestamps,
+        # and when it is next recomputed (picks up DST and clock changes)
+        self._midnight_ns = self._local_midnight_ns()
+        self._midnight_refresh_ns = time.time_ns() + self.MIDNIGHT_REFRESH_NS
+        
+        # Configuration snapshot taken by _commit_config:
+        # (num_readers, num_writers, read_delay, write_delay, writer_priority)
+        self._config = None
+        
+        # Room for the visualizers' pre-rendered backgrounds (in KB)
+        QPixmapCache.setCacheLimit(20480)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -35,6 +102,7 @@ class MainWindow(QMainWindow):
         # Central widget and main layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
+        central_widget.setStyleSheet(_BUTTONS_QSS)
         main_layout = QVBoxLayout(central_widget)
         
         # Create splitter for resizable sections
@@ -56,6 +124,12 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(splitter)
         
+        # Coalesce simulation updates into a fixed-rate GUI refresh (~30 Hz)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(33)
+        self._refresh_timer.timeout.connect(self._flush_stats)
+        self._refresh_timer.start()
+        
     def create_top_section(self):
         """Create the top control panel"""
         widget = QWidget()
@@ -68,65 +142,21 @@ class MainWindow(QMainWindow):
         # Start/Pause/Stop buttons
         btn_layout = QHBoxLayout()
         self.start_btn = QPushButton("▶ Start")
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-weight: bold;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.start_btn.setObjectName("start")
         self.start_btn.clicked.connect(self.start_simulation)
         
         self.pause_btn = QPushButton("⏸ Pause")
         self.pause_btn.setEnabled(False)
-        self.pause_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                font-weight: bold;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #e68a00;
-            }
-        """)
+        self.pause_btn.setObjectName("pause")
         self.pause_btn.clicked.connect(self.toggle_pause)
         
         self.stop_btn = QPushButton("⏹ Stop")
         self.stop_btn.setEnabled(False)
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                font-weight: bold;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-        """)
+        self.stop_btn.setObjectName("stop")
         self.stop_btn.clicked.connect(self.stop_simulation)
         
         self.reset_btn = QPushButton("🔄 Reset")
-        self.reset_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                font-weight: bold;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #0b7dda;
-            }
-        """)
+        self.reset_btn.setObjectName("reset")
         self.reset_btn.clicked.connect(self.reset_simulation)
         
         btn_layout.addWidget(self.start_btn)
@@ -154,69 +184,55 @@ class MainWindow(QMainWindow):
         control_group.setLayout(control_layout)
         layout.addWidget(control_group)
         
-        # Middle: Configuration sliders
+        # Middle: Configuration
+        # Values are read once by _commit_config (on Start or Apply) rather
+        # than mirrored into the GUI on every change
         config_group = QGroupBox("Configuration")
-        config_layout = QVBoxLayout()
+        config_layout = QGridLayout()
         
         # Number of readers
-        readers_layout = QHBoxLayout()
-        readers_layout.addWidget(QLabel("Readers:"))
-        self.readers_slider = QSlider(Qt.Orientation.Horizontal)
-        self.readers_slider.setRange(1, 30)
-        self.readers_slider.setValue(5)
-        self.readers_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.readers_slider.setTickInterval(5)
-        readers_layout.addWidget(self.readers_slider)
-        self.readers_label = QLabel("5")
-        readers_layout.addWidget(self.readers_label)
-        self.readers_slider.valueChanged.connect(
-            lambda v: self.readers_label.setText(str(v)))
-        config_layout.addLayout(readers_layout)
+        config_layout.addWidget(QLabel("Readers:"), 0, 0)
+        self.readers_spin = QSpinBox()
+        self.readers_spin.setRange(1, 30)
+        self.readers_spin.setValue(5)
+        self.readers_spin.valueChanged.connect(self._limit_thread_counts)
+        config_layout.addWidget(self.readers_spin, 0, 1)
         
         # Number of writers
-        writers_layout = QHBoxLayout()
-        writers_layout.addWidget(QLabel("Writers:"))
-        self.writers_slider = QSlider(Qt.Orientation.Horizontal)
-        self.writers_slider.setRange(1, 30)
-        self.writers_slider.setValue(3)
-        self.writers_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.writers_slider.setTickInterval(5)
-        writers_layout.addWidget(self.writers_slider)
-        self.writers_label = QLabel("3")
-        writers_layout.addWidget(self.writers_label)
-        self.writers_slider.valueChanged.connect(
-            lambda v: self.writers_label.setText(str(v)))
-        config_layout.addLayout(writers_layout)
+        config_layout.addWidget(QLabel("Writers:"), 1, 0)
+        self.writers_spin = QSpinBox()
+        self.writers_spin.setRange(1, 30)
+        self.writers_spin.setValue(3)
+        self.writers_spin.valueChanged.connect(self._limit_thread_counts)
+        config_layout.addWidget(self.writers_spin, 1, 1)
+        
+        # Each reader and writer holds a pool thread, so their total is capped
+        cap = SimulationManager.MAX_POOL_WORKERS
+        for spin in (self.readers_spin, self.writers_spin):
+            spin.setToolTip(f"Readers and writers share {cap} threads, "
+                            f"so at most {cap} in total")
+        self._limit_thread_counts()
         
         # Read delay
-        read_delay_layout = QHBoxLayout()
-        read_delay_layout.addWidget(QLabel("Read Delay (ms):"))
-        self.read_delay_slider = QSlider(Qt.Orientation.Horizontal)
-        self.read_delay_slider.setRange(100, 5000)
-        self.read_delay_slider.setValue(1000)
-        self.read_delay_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.read_delay_slider.setTickInterval(1000)
-        read_delay_layout.addWidget(self.read_delay_slider)
-        self.read_delay_label = QLabel("1000")
-        read_delay_layout.addWidget(self.read_delay_label)
-        self.read_delay_slider.valueChanged.connect(
-            lambda v: self.read_delay_label.setText(str(v)))
-        config_layout.addLayout(read_delay_layout)
+        config_layout.addWidget(QLabel("Read Delay (ms):"), 2, 0)
+        self.read_delay_spin = QSpinBox()
+        self.read_delay_spin.setRange(100, 5000)
+        self.read_delay_spin.setSingleStep(100)
+        self.read_delay_spin.setValue(1000)
+        config_layout.addWidget(self.read_delay_spin, 2, 1)
         
         # Write delay
-        write_delay_layout = QHBoxLayout()
-        write_delay_layout.addWidget(QLabel("Write Delay (ms):"))
-        self.write_delay_slider = QSlider(Qt.Orientation.Horizontal)
-        self.write_delay_slider.setRange(100, 5000)
-        self.write_delay_slider.setValue(2000)
-        self.write_delay_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.write_delay_slider.setTickInterval(1000)
-        write_delay_layout.addWidget(self.write_delay_slider)
-        self.write_delay_label = QLabel("2000")
-        write_delay_layout.addWidget(self.write_delay_label)
-        self.write_delay_slider.valueChanged.connect(
-            lambda v: self.write_delay_label.setText(str(v)))
-        config_layout.addLayout(write_delay_layout)
+        config_layout.addWidget(QLabel("Write Delay (ms):"), 3, 0)
+        self.write_delay_spin = QSpinBox()
+        self.write_delay_spin.setRange(100, 5000)
+        self.write_delay_spin.setSingleStep(100)
+        self.write_delay_spin.setValue(2000)
+        config_layout.addWidget(self.write_delay_spin, 3, 1)
+        
+        # Apply settings to a running simulation
+        self.apply_btn = QPushButton("Apply")
+        self.apply_btn.clicked.connect(self._commit_config)
+        config_layout.addWidget(self.apply_btn, 4, 0, 1, 2)
         
         config_group.setLayout(config_layout)
         layout.addWidget(config_group)
@@ -225,36 +241,36 @@ class MainWindow(QMainWindow):
         stats_group = QGroupBox("Live Statistics")
         stats_layout = QGridLayout()
         
-        stats_font = QFont()
-        stats_font.setBold(True)
-        stats_font.setPointSize(12)
+        self._stats_font = QFont()
+        self._stats_font.setBold(True)
+        self._stats_font.setPointSize(12)
         
         # Active readers
         stats_layout.addWidget(QLabel("Active Readers:"), 0, 0)
         self.active_readers_label = QLabel("0")
-        self.active_readers_label.setFont(stats_font)
-        self.active_readers_label.setStyleSheet("color: #4CAF50;")
+        self.active_readers_label.setFont(self._stats_font)
+        self.active_readers_label.setStyleSheet(_GREEN_SS)
         stats_layout.addWidget(self.active_readers_label, 0, 1)
         
         # Waiting readers
         stats_layout.addWidget(QLabel("Waiting Readers:"), 1, 0)
         self.waiting_readers_label = QLabel("0")
-        self.waiting_readers_label.setFont(stats_font)
-        self.waiting_readers_label.setStyleSheet("color: #FFC107;")
+        self.waiting_readers_label.setFont(self._stats_font)
+        self.waiting_readers_label.setStyleSheet(_AMBER_SS)
         stats_layout.addWidget(self.waiting_readers_label, 1, 1)
         
         # Active writers
         stats_layout.addWidget(QLabel("Active Writers:"), 2, 0)
         self.active_writers_label = QLabel("0")
-        self.active_writers_label.setFont(stats_font)
-        self.active_writers_label.setStyleSheet("color: #f44336;")
+        self.active_writers_label.setFont(self._stats_font)
+        self.active_writers_label.setStyleSheet(_RED_SS)
         stats_layout.addWidget(self.active_writers_label, 2, 1)
         
         # Waiting writers
         stats_layout.addWidget(QLabel("Waiting Writers:"), 3, 0)
         self.waiting_writers_label = QLabel("0")
-        self.waiting_writers_label.setFont(stats_font)
-        self.waiting_writers_label.setStyleSheet("color: #FFC107;")
+        self.waiting_writers_label.setFont(self._stats_font)
+        self.waiting_writers_label.setStyleSheet(_AMBER_SS)
         stats_layout.addWidget(self.waiting_writers_label, 3, 1)
         
         # Throughput
@@ -269,7 +285,7 @@ class MainWindow(QMainWindow):
         # Conflicts
         stats_layout.addWidget(QLabel("Access Conflicts:"), 2, 2)
         self.conflicts_label = QLabel("0")
-        self.conflicts_label.setStyleSheet("color: #ff5722;")
+        self.conflicts_label.setStyleSheet(_CONFLICT_SS)
         stats_layout.addWidget(self.conflicts_label, 2, 3)
         
         stats_group.setLayout(stats_layout)
@@ -283,25 +299,44 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(widget)
         
         # Resource visualization
+        # The visualizers themselves are created on first start; until then
+        # placeholders hold their place in the layout
         resource_group = QGroupBox("Shared Resource Access")
-        resource_layout = QVBoxLayout()
+        self._resource_layout = QVBoxLayout()
         
-        self.resource_visualizer = ResourceVisualizer()
-        resource_layout.addWidget(self.resource_visualizer)
-        resource_group.setLayout(resource_layout)
+        self._resource_placeholder = QWidget()
+        self._resource_layout.addWidget(self._resource_placeholder)
+        resource_group.setLayout(self._resource_layout)
         layout.addWidget(resource_group)
         
         # Thread visualization
         thread_group = QGroupBox("Thread Status Visualization")
-        thread_layout = QVBoxLayout()
+        self._thread_layout = QVBoxLayout()
         
-        self.thread_visualizer = ThreadVisualizer()
-        thread_layout.addWidget(self.thread_visualizer)
-        thread_group.setLayout(thread_layout)
+        self._thread_placeholder = QWidget()
+        self._thread_layout.addWidget(self._thread_placeholder)
+        thread_group.setLayout(self._thread_layout)
         layout.addWidget(thread_group)
         
         return widget
     
+    def _ensure_visualizers(self):
+        """Create the visualizers in place of their placeholders if needed"""
+        if self.thread_visualizer is not None:
+            return
+        
+        self.resource_visualizer = ResourceVisualizer()
+        self._resource_layout.replaceWidget(self._resource_placeholder,
+                                            self.resource_visualizer)
+        self._resource_placeholder.deleteLater()
+        self._resource_placeholder = None
+        
+        self.thread_visualizer = ThreadVisualizer()
+        self._thread_layout.replaceWidget(self._thread_placeholder,
+                                          self.thread_visualizer)
+        self._thread_placeholder.deleteLater()
+        self._thread_placeholder = None
+    
     def create_log_section(self):
         """Create the log section"""
         widget = QWidget()
@@ -312,7 +347,7 @@ class MainWindow(QMainWindow):
         
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setMaximumHeight(200)
+        self.log_text.document().setMaximumBlockCount(self.MAX_LOG_BLOCKS)
         self.log_text.setStyleSheet("""
             QTextEdit {
                 background-color: #f5f5f5;
@@ -322,12 +357,20 @@ class MainWindow(QMainWindow):
             }
         """)
         
+        # Debug messages are filtered out in the simulation unless enabled
+        self.debug_check = QCheckBox("Show debug messages")
+        self.debug_check.toggled.connect(self._apply_log_level)
+        
         # Clear log button
         clear_btn = QPushButton("Clear Log")
         clear_btn.clicked.connect(self.log_text.clear)
         
+        log_buttons = QHBoxLayout()
+        log_buttons.addWidget(self.debug_check)
+        log_buttons.addWidget(clear_btn)
+        
         log_layout.addWidget(self.log_text)
-        log_layout.addWidget(clear_btn)
+        log_layout.addLayout(log_buttons)
         log_group.setLayout(log_layout)
         layout.addWidget(log_group)
         
@@ -339,37 +382,76 @@ class MainWindow(QMainWindow):
             return
             
         # Get configuration values
-        num_readers = self.readers_slider.value()
-        num_writers = self.writers_slider.value()
-        read_delay = self.read_delay_slider.value() / 1000.0  # Convert to seconds
-        write_delay = self.write_delay_slider.value() / 1000.0
-        writer_priority = self.priority_combo.currentIndex() == 1
-        
-        # Create simulation manager
-        self.simulation = SimulationManager(
-            num_readers=num_readers,
-            num_writers=num_writers,
-            read_delay=read_delay,
-            write_delay=write_delay,
-            writer_priority=writer_priority
-        )
+        self._commit_config()
+        (num_readers, num_writers, read_delay, write_delay,
+         writer_priority) = self._config
         
-        # Connect signals
-        self.simulation.status_update.connect(self.update_status)
-        self.simulation.log_message.connect(self.add_log_message)
-        self.simulation.reader_active.connect(self.resource_visualizer.set_reader_active)
-        self.simulation.writer_active.connect(self.resource_visualizer.set_writer_active)
-        self.simulation.thread_update.connect(self.thread_visualizer.update_thread)
+        self._ensure_visualizers()
+        self.thread_visualizer.preallocate(num_readers, num_writers)
         
         # Update button states
         self.start_btn.setEnabled(False)
         self.pause_btn.setEnabled(True)
         self.stop_btn.setEnabled(True)
         
-        # Start simulation
-        self.simulation.start()
+        if self.simulation is not None:
+            # Reuse the stopped manager; its signals are already connected
+            self.simulation.reconfigure(num_readers, num_writers,
+                                        read_delay, write_delay,
+                                        writer_priority)
+            self.simulation.restart()
+        else:
+            # Create simulation manager
+            self.simulation = SimulationManager(
+                num_readers=num_readers,
+                num_writers=num_writers,
+                read_delay=read_delay,
+                write_delay=write_delay,
+                writer_priority=writer_priority
+            )
+            
+            self._apply_log_level()
+            
+            # Connect signals
+            self.simulation.status_update.connect(self.update_status)
+            self.simulation.log_message.connect(self.add_log_message)
+            queued = Qt.ConnectionType.QueuedConnection
+            self.simulation.reader_active.connect(
+                self.resource_visualizer.set_reader_active, queued)
+            self.simulation.writer_active.connect(
+                self.resource_visualizer.set_writer_active, queued)
+            self.simulation.thread_updates.connect(
+                self.thread_visualizer.update_threads, queued)
+            
+            # Start simulation
+            self.simulation.start()
+        
+        self.add_log_message("Simulation started", LOG_INFO)
+        
+    def _commit_config(self):
+        """Snapshot the configuration widgets and apply them if running"""
+        self._config = (
+            self.readers_spin.value(),
+            self.writers_spin.value(),
+            self.read_delay_spin.value() / 1000.0,  # Convert to seconds
+            self.write_delay_spin.value() / 1000.0,
+            self.priority_combo.currentIndex() == 1
+        )
         
-        self.add_log_message("Simulation started", "INFO")
+        if self.simulation and self.simulation.is_running():
+            self.simulation.reconfigure(*self._config)
+        
+    def _limit_thread_counts(self):
+        """Keep readers plus writers within the simulation's thread pool"""
+        cap = SimulationManager.MAX_POOL_WORKERS
+        self.readers_spin.setMaximum(min(30, cap - self.writers_spin.value()))
+        self.writers_spin.setMaximum(min(30, cap - self.readers_spin.value()))
+        
+    def _apply_log_level(self):
+        """Pass the log level chosen in the GUI to the simulation"""
+        if self.simulation:
+            self.simulation.min_log_level = (
+                logging.DEBUG if self.debug_check.isChecked() else logging.INFO)
         
     def toggle_pause(self):
         """Toggle simulation pause state"""
@@ -377,11 +459,11 @@ class MainWindow(QMainWindow):
             if self.simulation.is_paused():
                 self.simulation.resume()
                 self.pause_btn.setText("⏸ Pause")
-                self.add_log_message("Simulation resumed", "INFO")
+                self.add_log_message("Simulation resumed", LOG_INFO)
             else:
                 self.simulation.pause()
                 self.pause_btn.setText("▶ Resume")
-                self.add_log_message("Simulation paused", "INFO")
+                self.add_log_message("Simulation paused", LOG_INFO)
     
     def stop_simulation(self):
         """Stop the simulation"""
@@ -391,12 +473,24 @@ class MainWindow(QMainWindow):
             self.pause_btn.setEnabled(False)
             self.stop_btn.setEnabled(False)
             self.pause_btn.setText("⏸ Pause")
-            self.add_log_message("Simulation stopped", "INFO")
+            self.add_log_message("Simulation stopped", LOG_INFO)
     
     def reset_simulation(self):
         """Reset the simulation"""
         self.stop_simulation()
         
+        # Drop the manager so the next start begins with fresh counters.
+        # Its lock and stats thread may still emit while late cycles
+        # finish, so cut it off from the widgets first
+        if self.simulation is not None:
+            for signal in (self.simulation.status_update,
+                           self.simulation.log_message,
+                           self.simulation.reader_active,
+                           self.simulation.writer_active,
+                           self.simulation.thread_updates):
+                signal.disconnect()
+            self.simulation = None
+        
         # Reset visualizations
         if self.thread_visualizer:
             self.thread_visualizer.reset()
@@ -411,48 +505,123 @@ class MainWindow(QMainWindow):
         self.reads_completed_label.setText("0")
         self.writes_completed_label.setText("0")
         self.conflicts_label.setText("0")
+        self._pending_stats = None
+        self._rendered_stats = [0] * 7
         
+        self._log_buffer.clear()
+        self._last_log_key = None
         self.log_text.clear()
-        self.add_log_message("Simulation reset", "INFO")
+        self.add_log_message("Simulation reset", LOG_INFO)
+    
+    @pyqtSlot(int, int, int, int, int, int, int)
+    def update_status(self, active_readers: int, waiting_readers: int,
+                      active_writers: int, waiting_writers: int,
+                      reads_completed: int, writes_completed: int,
+                      conflicts: int):
+        """Store the latest stats; labels are refreshed by _flush_stats"""
+        self._pending_stats = (active_readers, waiting_readers,
+                               active_writers, waiting_writers,
+                               reads_completed, writes_completed,
+                               conflicts)
+    
+    def _flush_stats(self):
+        """Apply buffered stats and log messages to the widgets"""
+        if self._log_buffer:
+            if self.log_text.visibleRegion().isEmpty():
+                # Log pane hidden or collapsed: keep only what the document
+                # would retain anyway and write it once the pane is shown
+                del self._log_buffer[:-self.MAX_LOG_BLOCKS]
+            else:
+                self._flush_log()
+        
+        stats = self._pending_stats
+        if stats is None:
+            return
+        self._pending_stats = None
+        
+        labels = (
+            self.active_readers_label,
+            self.waiting_readers_label,
+            self.active_writers_label,
+            self.waiting_writers_label,
+            self.reads_completed_label,
+            self.writes_completed_label,
+            self.conflicts_label,
+        )
+        rendered = self._rendered_stats
+        for i, value in enumerate(stats):
+            # Skip labels whose value has not changed since the last refresh
+            if rendered[i] != value:
+                labels[i].setText(str(value))
+                rendered[i] = value
+        
+        if self.resource_visualizer:
+            self.resource_visualizer.set_active_readers(stats[0])
+            # reads_completed + writes_completed
+            self.resource_visualizer.set_access_count(stats[4] + stats[5])
     
-    @pyqtSlot(dict)
-    def update_status(self, stats: Dict):
-        """Update status labels from simulation"""
-        self.active_readers_label.setText(str(stats['active_readers']))
-        self.waiting_readers_label.setText(str(stats['waiting_readers']))
-        self.active_writers_label.setText(str(stats['active_writers']))
-        self.waiting_writers_label.setText(str(stats['waiting_writers']))
-        self.reads_completed_label.setText(str(stats['reads_completed']))
-        self.writes_completed_label.setText(str(stats['writes_completed']))
-        self.conflicts_label.setText(str(stats['conflicts']))
+    def _flush_log(self):
+        """Write all buffered log entries to the log view in one edit block"""
+        self.log_text.setUpdatesEnabled(False)
+        
+        cursor = self.log_text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        # One block per entry so the document's block limit evicts whole lines
+        first = self.log_text.document().isEmpty()
+        for entry in self._log_buffer:
+            if not first:
+                cursor.insertBlock()
+            first = False
+            cursor.insertHtml(entry)
+        cursor.endEditBlock()
+        self._log_buffer.clear()
+        
+        # Auto-scroll to bottom: the cursor is already at the end
+        self.log_text.setTextCursor(cursor)
+        self.log_text.ensureCursorVisible()
+        
+        self.log_text.setUpdatesEnabled(True)
     
     @pyqtSlot(str, str)
-    def add_log_message(self, message: str, level: str = "INFO"):
-        """Add a message to the log"""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        
-        # Color coding based on level
-        if level == "ERROR":
-            color = "#f44336"
-            prefix = "[ERROR]"
-        elif level == "WARNING":
-            color = "#ff9800"
-            prefix = "[WARN]"
-        elif level == "DEBUG":
-            color = "#9c27b0"
-            prefix = "[DEBUG]"
-        else:
-            color = "#4CAF50"
-            prefix = "[INFO]"
+    def add_log_message(self, message: str, level: str = LOG_INFO):
+        """Queue a message for the log; written out by _flush_stats"""
+        # Drop consecutive duplicates (e.g. the same event logged twice)
+        log_key = (message, level)
+        if log_key == self._last_log_key:
+            return
+        self._last_log_key = log_key
         
-        log_entry = f'<span style="color: #888;">[{timestamp}]</span> '\
-                   f'<span style="color: {color};">{prefix}</span> {message}'
+        timestamp = self._format_timestamp()
         
-        self.log_text.append(log_entry)
+        prefix_html = _LEVEL_HTML.get(level) or _LEVEL_HTML[LOG_INFO]
+        log_entry = _LOG_TEMPLATE % (timestamp, prefix_html, message)
         
-        # Auto-scroll to bottom
-        scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self._log_buffer.append(log_entry)
+    
+    @staticmethod
+    def _local_midnight_ns() -> int:
+        """Return the most recent local midnight as epoch nanoseconds"""
+        now_ns = time.time_ns()
+        local = time.localtime(now_ns // 1_000_000_000)
+        seconds_today = local.tm_hour * 3600 + local.tm_min * 60 + local.tm_sec
+        return now_ns - seconds_today * 1_000_000_000 - now_ns % 1_000_000_000
+    
+    def _format_timestamp(self) -> str:
+        """Format the current local time as HH:MM:SS.mmm without datetime"""
+        now_ns = time.time_ns()
+        ns = now_ns - self._midnight_ns
+        if (ns < 0 or ns >= 86_400_000_000_000 or
+                now_ns >= self._midnight_refresh_ns):
+            # Crossed midnight, the wall clock was set back, or the periodic
+            # refresh is due so a DST shift is off for at most a minute
+            self._midnight_ns = self._local_midnight_ns()
+            self._midnight_refresh_ns = now_ns + self.MIDNIGHT_REFRESH_NS
+            ns = time.time_ns() - self._midnight_ns
+        s, rem = divmod(ns, 1_000_000_000)
+        h, s = divmod(s, 3600)
+        m, s = divmod(s, 60)
+        return f"{h:02d}:{m:02d}:{s:02d}.{rem // 1_000_000:03d}"
     
     def closeEvent(self, event):
         """Handle window close event"""
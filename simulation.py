@@ -2,18 +2,42 @@
 Simulation Manager - Coordinates threads and synchronization
 Handles thread creation, management, and communication with GUI
 """
+import concurrent.futures
+import logging
+import logging.handlers
+import queue
+import sys
 import threading
 import time
-import queue
+from collections import deque
 from typing import Dict, Optional
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
 from sync import ReaderWriterLock, DatabaseSimulator
 
 
+# Log levels carried by SimulationManager.log_message
+LOG_DEBUG = sys.intern("DEBUG")
+LOG_INFO = sys.intern("INFO")
+LOG_WARNING = sys.intern("WARNING")
+LOG_ERROR = sys.intern("ERROR")
+
+# Numeric rank of each level, compared against min_log_level
+LOG_LEVELS = {
+    LOG_DEBUG: logging.DEBUG,
+    LOG_INFO: logging.INFO,
+    LOG_WARNING: logging.WARNING,
+    LOG_ERROR: logging.ERROR,
+}
+_LEVEL_NAMES = {number: name for name, number in LOG_LEVELS.items()}
+
 class ThreadMessage:
     """Message sent from worker threads to GUI."""
     
+    # One is allocated per worker state change; slots skip the per-instance dict
+    __slots__ = ('thread_type', 'thread_id', 'action', 'status', 'data',
+                 'timestamp')
+    
     def __init__(self, thread_type: str, thread_id: int, 
                  action: str, status: str, data: Optional[str] = None):
         """
@@ -31,7 +55,7 @@ class ThreadMessage:
         self.action = action
         self.status = status
         self.data = data
-        self.timestamp = time.time()
+        self.timestamp = time.monotonic()
 
 
 class SimulationManager(QObject):
@@ -43,15 +67,28 @@ class SimulationManager(QObject):
     """
     
     # Signals for GUI updates
-    status_update = pyqtSignal(dict)  # Statistics updates
+    # Statistics updates: active readers, waiting readers, active writers,
+    # waiting writers, reads completed, writes completed, conflicts
+    status_update = pyqtSignal(int, int, int, int, int, int, int)
     log_message = pyqtSignal(str, str)  # Log messages (message, level)
-    thread_update = pyqtSignal(dict)  # Thread status updates
+    thread_updates = pyqtSignal(list)  # Batch of thread status update dicts
     reader_active = pyqtSignal(bool)  # Reader active in resource
     writer_active = pyqtSignal(bool)  # Writer active in resource
+    _pool_drained = pyqtSignal()  # A stopped run's last cycles finished
+    
+    # Worker pool threads, and so the most readers plus writers a run has;
+    # a cycle holds its thread through the lock wait and between-cycle pause
+    MAX_POOL_WORKERS = 32
+    
+    # Messages buffered per worker between drains
+    WORKER_BUFFER_SIZE = 64
+    
+    # Consecutive failed cycles a reader/writer retries before giving up
+    MAX_WORKER_RETRIES = 3
     
     def __init__(self, num_readers: int = 5, num_writers: int = 3,
                  read_delay: float = 1.0, write_delay: float = 2.0,
-                 writer_priority: bool = False):
+                 writer_priority: bool = False, work_mode: str = 'sleep'):
         """
         Initialize simulation manager.
         
@@ -61,6 +98,8 @@ class SimulationManager(QObject):
             read_delay: Simulated read operation time (seconds)
             write_delay: Simulated write operation time (seconds)
             writer_priority: True for writer priority, False for reader priority
+            work_mode: How reads/writes spend their delay, 'sleep' or 'hash'
+                       (see DatabaseSimulator)
         """
         super().__init__()
         
@@ -70,23 +109,59 @@ class SimulationManager(QObject):
         self.read_delay = read_delay
         self.write_delay = write_delay
         self.writer_priority = writer_priority
+        self._clamp_thread_counts()
         
         # Synchronization primitives
         self.rw_lock = ReaderWriterLock(writer_priority)
-        self.database = DatabaseSimulator()
-        
-        # Thread management
-        self.reader_threads = []
-        self.writer_threads = []
+        # The lock reports only overall start/stop of reading and writing,
+        # not every reader's entry and exit
+        self.rw_lock.on_reader_active = self.reader_active.emit
+        self.rw_lock.on_writer_active = self.writer_active.emit
+        self.database = DatabaseSimulator(work_mode=work_mode)
+        
+        # Thread management. Readers and writers run as repeating tasks on
+        # a bounded pool instead of one OS thread each
+        self._pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
         self.thread_counter = 0
         
         # Control flags
         self.running = False
-        self.paused = False
-        self.pause_condition = threading.Condition()
         
-        # Message queue for thread-GUI communication
-        self.message_queue = queue.Queue()
+        # Set while workers may run, cleared while paused
+        self._run_event = threading.Event()
+        self._run_event.set()
+        
+        # Set by stop() so workers leave their between-cycle pause at once
+        self._shutdown_event = threading.Event()
+        
+        # Worker threads log through this logger. Its QueueHandler only
+        # enqueues records, and process_messages forwards them to
+        # log_message on the GUI thread. The logger is private to this
+        # manager (not registered by name), so its handler never outlives it
+        self._log_queue = queue.SimpleQueue()
+        self._logger = logging.Logger("simulation")
+        self._logger.addHandler(logging.handlers.QueueHandler(self._log_queue))
+        
+        # Messages below this level (a logging.* int) are never built or
+        # emitted; the GUI lowers it to logging.DEBUG on request
+        self.min_log_level = logging.INFO
+        
+        # Per-worker message buffers for thread-GUI communication, keyed by
+        # (thread_type, thread_id). Each has a single producer, and
+        # deque.append and popleft are atomic, so producers never block or
+        # share a queue; when full, a worker's oldest messages are dropped.
+        # start() replaces the dict, so a cycle left over from a stopped run
+        # writes only to that run's buffers
+        self._worker_buffers: Dict[tuple, deque] = {}
+        
+        # The buffers are drained on the GUI thread at ~30 Hz
+        self._message_timer = QTimer(self)
+        self._message_timer.setInterval(33)
+        self._message_timer.timeout.connect(self.process_messages)
+        
+        # Emitted from a helper thread, so the final drain after stop()
+        # is queued to the GUI thread
+        self._pool_drained.connect(self.process_messages)
         
         # Statistics timer
         self.stats_timer = None
@@ -95,82 +170,114 @@ class SimulationManager(QObject):
         self.next_reader_id = 1
         self.next_writer_id = 1
         
+        # Incremented on every start so threads left over from a previous
+        # run (still finishing a read/write after stop) exit on their own
+        self._run_id = 0
+        
     def start(self):
         """Start the simulation."""
         if self.running:
-            self.log_message.emit("Simulation already running", "WARNING")
+            self.log_message.emit("Simulation already running", LOG_WARNING)
             return
         
         self.running = True
-        self.paused = False
-        
-        # Create reader threads
+        self._shutdown_event.clear()
+        self._run_event.set()
+        self._run_id += 1
+        
+        # Fresh buffers; anything a previous run left undelivered is dropped
+        self._worker_buffers = {}
+        
+        # One pool thread per reader/writer; _clamp_thread_counts keeps
+        # the total within MAX_POOL_WORKERS
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(self.MAX_POOL_WORKERS,
+                                   self.num_readers + self.num_writers)),
+            thread_name_prefix="Worker"
+        )
+        
+        # Submit the first cycle of each reader
         for i in range(self.num_readers):
-            thread = threading.Thread(
-                target=self.reader_worker,
-                args=(self.next_reader_id,),
-                daemon=True,
-                name=f"Reader-{self.next_reader_id}"
-            )
-            self.reader_threads.append(thread)
+            self._worker_buffers[('reader', self.next_reader_id)] = deque(
+                maxlen=self.WORKER_BUFFER_SIZE)
+            self._submit(self._pool, self.reader_worker, self.next_reader_id,
+                         self._run_id)
             self.next_reader_id += 1
         
-        # Create writer threads
+        # Submit the first cycle of each writer
         for i in range(self.num_writers):
-            thread = threading.Thread(
-                target=self.writer_worker,
-                args=(self.next_writer_id,),
-                daemon=True,
-                name=f"Writer-{self.next_writer_id}"
-            )
-            self.writer_threads.append(thread)
+            self._worker_buffers[('writer', self.next_writer_id)] = deque(
+                maxlen=self.WORKER_BUFFER_SIZE)
+            self._submit(self._pool, self.writer_worker, self.next_writer_id,
+                         self._run_id)
             self.next_writer_id += 1
         
-        # Start all threads
-        for thread in self.reader_threads + self.writer_threads:
-            thread.start()
-        
         # Start statistics update timer
         self.stats_timer = threading.Thread(target=self.stats_worker, daemon=True)
         self.stats_timer.start()
         
         # Start message processor
-        self.message_processor = threading.Thread(target=self.process_messages, daemon=True)
-        self.message_processor.start()
+        self._message_timer.start()
         
-        self.log_message.emit(f"Started {self.num_readers} readers and {self.num_writers} writers", "INFO")
+        self.log_message.emit(f"Started {self.num_readers} readers and {self.num_writers} writers", LOG_INFO)
         
     def pause(self):
         """Pause the simulation."""
-        with self.pause_condition:
-            self.paused = True
-            self.log_message.emit("Simulation paused", "INFO")
+        self._run_event.clear()
+        self.log_message.emit("Simulation paused", LOG_INFO)
     
     def resume(self):
         """Resume the simulation."""
-        with self.pause_condition:
-            self.paused = False
-            self.pause_condition.notify_all()
-            self.log_message.emit("Simulation resumed", "INFO")
+        self._run_event.set()
+        self.log_message.emit("Simulation resumed", LOG_INFO)
     
     def stop(self):
         """Stop the simulation."""
+        self._shutdown_event.set()
         self.running = False
         
         # Resume if paused to allow threads to exit
-        with self.pause_condition:
-            self.paused = False
-            self.pause_condition.notify_all()
-        
-        # Wait for threads to finish (with timeout)
-        for thread in self.reader_threads + self.writer_threads:
-            thread.join(timeout=1.0)
-        
-        # Clear thread lists
-        self.reader_threads.clear()
-        self.writer_threads.clear()
+        self._run_event.set()
+        
+        # In-flight cycles finish on their own and do not re-submit;
+        # queued ones return immediately. Their last messages are drained
+        # once the pool is idle, without blocking the GUI thread
+        pool = self._pool
+        if pool is not None:
+            pool.shutdown(wait=False)
+            self._pool = None
+            threading.Thread(target=self._wait_for_pool, args=(pool,),
+                             daemon=True).start()
+        
+        # Deliver the thread states so far before going idle
+        self._message_timer.stop()
+        self.process_messages()
+        
+        self.log_message.emit("Simulation stopped", LOG_INFO)
+    
+    def restart(self):
+        """Start again after stop(), reusing this manager and its lock."""
+        if self.running:
+            self.log_message.emit("Simulation already running", LOG_WARNING)
+            return
         
-        self.log_message.emit("Simulation stopped", "INFO")
+        # New threads reuse IDs from 1 so the GUI keeps the same widgets
+        self.next_reader_id = 1
+        self.next_writer_id = 1
+        self.start()
+    
+    @property
+    def min_log_level(self) -> int:
+        """Lowest level that is logged, as a logging.* int."""
+        return self._logger.level
+    
+    @min_log_level.setter
+    def min_log_level(self, level: int):
+        self._logger.setLevel(level)
+        # setLevel only clears the isEnabledFor cache of loggers registered
+        # with the logging manager; this one is not, so clear it here or a
+        # cached result would outlive the level change
+        self._logger._cache.clear()
     
     def is_running(self) -> bool:
         """Check if simulation is running."""
@@ -178,163 +285,296 @@ class SimulationManager(QObject):
     
     def is_paused(self) -> bool:
         """Check if simulation is paused."""
-        return self.paused
+        return not self._run_event.is_set()
+    
+    def _wait_for_pool(self, pool: concurrent.futures.ThreadPoolExecutor):
+        """Helper thread: signal the final drain once a stopped pool is idle."""
+        pool.shutdown(wait=True)
+        self._pool_drained.emit()
+    
+    def _clamp_thread_counts(self):
+        """Scale readers and writers down to MAX_POOL_WORKERS in total."""
+        total = self.num_readers + self.num_writers
+        if total <= self.MAX_POOL_WORKERS:
+            return
+        cap = self.MAX_POOL_WORKERS
+        self.num_readers = min(cap - 1, max(1, round(cap * self.num_readers / total)))
+        self.num_writers = cap - self.num_readers
+        self.log_message.emit(
+            f"At most {self.MAX_POOL_WORKERS} readers and writers in total; "
+            f"using {self.num_readers} readers and {self.num_writers} writers",
+            LOG_WARNING)
+    
+    def _sender(self, thread_type: str, thread_id: int):
+        """
+        Return a send(action, status, data=None) function for one cycle.
+        
+        It is bound to the worker's buffer of the current run, so messages
+        from a cycle still in flight after restart() never reach the next
+        run.
+        """
+        append = self._worker_buffers[(thread_type, thread_id)].append
+        
+        def send(action: str, status: str, data: Optional[str] = None):
+            append(ThreadMessage(thread_type, thread_id, action, status, data))
+        
+        return send
+    
+    def _submit(self, pool: concurrent.futures.ThreadPoolExecutor, fn,
+                worker_id: int, run_id: int, failures: int = 0):
+        """
+        Queue one worker cycle on the pool.
+        
+        Nothing reads the returned futures, so an unexpected exception that
+        ends a cycle (and with it the worker) is logged from a callback.
+        """
+        future = pool.submit(fn, worker_id, run_id, failures)
+        kind = 'Reader' if fn == self.reader_worker else 'Writer'
+        future.add_done_callback(
+            lambda f: self._log_worker_exit(f, kind, worker_id))
+    
+    def _log_worker_exit(self, future: concurrent.futures.Future,
+                         kind: str, worker_id: int):
+        """Log a worker cycle that ended with an exception."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self._logger.error("%s %d stopped by unexpected error: %s: %s",
+                               kind, worker_id, type(error).__name__, error)
+    
+    def _resubmit(self, fn, worker_id: int, run_id: int, failures: int = 0):
+        """Queue a worker's next cycle unless its run has ended."""
+        pool = self._pool
+        if pool is None or not self.running or run_id != self._run_id:
+            return
+        try:
+            self._submit(pool, fn, worker_id, run_id, failures)
+        except RuntimeError:
+            pass  # Pool shut down by stop() or interpreter exit
     
-    def reader_worker(self, reader_id: int):
+    def reader_worker(self, reader_id: int, run_id: int, failures: int = 0):
         """
-        Reader thread worker function.
+        Reader task: one read cycle, run on the worker pool.
         
-        Continuously attempts to read from the database.
-        Follows the synchronization protocol.
+        Follows the synchronization protocol, then re-submits itself so
+        the next read attempt queues behind the other workers' cycles.
+        A failed read is retried on the next cycle; the reader gives up
+        after MAX_WORKER_RETRIES consecutive failures.
         """
-        read_count = 0
+        if not self.running or run_id != self._run_id:
+            return
+        
+        # Block while the simulation is paused
+        self._run_event.wait()
+        
+        if not self.running:
+            return
+        
+        # Local bindings for the names used throughout the cycle
+        _send = self._sender('reader', reader_id)
+        rw = self.rw_lock
         
-        while self.running:
-            # Check if simulation is paused
-            with self.pause_condition:
-                while self.paused and self.running:
-                    self.pause_condition.wait()
+        # Request read access. The waiting state is only sent when the
+        # reader actually has to wait
+        if rw.try_reader_enter(reader_id):
+            wait_time = 0.0
+        else:
+            _send('enter', 'waiting')
+            wait_time = rw.reader_enter(reader_id)
+        
+        try:
+            if wait_time > 0:
+                self._logger.debug("Reader %d waited %.2fs to enter",
+                                   reader_id, wait_time)
             
-            if not self.running:
-                break
+            # Signal active reading
+            _send('read', 'active')
             
+            # Perform read operation
             try:
-                # Signal waiting to enter
-                self.send_thread_message('reader', reader_id, 'enter', 'waiting')
-                
-                # Request read access
-                wait_time = self.rw_lock.reader_enter(reader_id)
-                
-                if wait_time > 0:
-                    self.log_message.emit(
-                        f"Reader {reader_id} waited {wait_time:.2f}s to enter",
-                        "DEBUG"
-                    )
-                
-                # Signal active reading
-                self.send_thread_message('reader', reader_id, 'read', 'active')
-                self.reader_active.emit(True)
-                
-                # Perform read operation
                 result = self.database.read(reader_id, self.read_delay)
-                
+            except (RuntimeError, OSError) as e:
+                failures += 1
+                self._logger.error("Reader %d error: %s", reader_id, e)
+                _send('exit', 'completed')
+                if failures > self.MAX_WORKER_RETRIES:
+                    self._logger.error("Reader %d gave up after %d failed reads",
+                                       reader_id, failures)
+                    return
+            else:
+                failures = 0
                 # Signal completion
-                self.send_thread_message('reader', reader_id, 'exit', 'completed', result)
-                self.reader_active.emit(False)
-                
-                # Release read access
-                self.rw_lock.reader_exit()
-                
-                read_count += 1
-                
-                # Brief pause before next read attempt
-                time.sleep(0.5)
-                
-            except Exception as e:
-                self.log_message.emit(
-                    f"Reader {reader_id} error: {str(e)}",
-                    "ERROR"
-                )
-                break
+                _send('exit', 'completed', result)
+        finally:
+            # Release read access, even if the read failed
+            rw.reader_exit()
+        
+        # Brief pause before next read attempt; ends early on stop()
+        if self._shutdown_event.wait(0.5):
+            return
+        
+        self._resubmit(self.reader_worker, reader_id, run_id, failures)
     
-    def writer_worker(self, writer_id: int):
+    def writer_worker(self, writer_id: int, run_id: int, failures: int = 0):
         """
-        Writer thread worker function.
+        Writer task: one write cycle, run on the worker pool.
         
-        Continuously attempts to write to the database.
-        Follows the synchronization protocol.
+        Follows the synchronization protocol, then re-submits itself so
+        the next write attempt queues behind the other workers' cycles.
+        A failed write is retried on the next cycle; the writer gives up
+        after MAX_WORKER_RETRIES consecutive failures.
         """
-        write_count = 0
+        if not self.running or run_id != self._run_id:
+            return
         
-        while self.running:
-            # Check if simulation is paused
-            with self.pause_condition:
-                while self.paused and self.running:
-                    self.pause_condition.wait()
+        # Block while the simulation is paused
+        self._run_event.wait()
+        
+        if not self.running:
+            return
+        
+        # Local bindings for the names used throughout the cycle
+        _send = self._sender('writer', writer_id)
+        rw = self.rw_lock
+        
+        # Request write access. The waiting state is only sent when the
+        # writer actually has to wait
+        if rw.try_writer_enter(writer_id):
+            wait_time = 0.0
+        else:
+            _send('enter', 'waiting')
+            wait_time = rw.writer_enter(writer_id)
+        
+        try:
+            if wait_time > 0:
+                self._logger.debug("Writer %d waited %.2fs to enter",
+                                   writer_id, wait_time)
             
-            if not self.running:
-                break
+            # Signal active writing
+            _send('write', 'active')
             
+            # Perform write operation
+            data = f"Data written by Writer {writer_id} at {time.time():.2f}"
             try:
-                # Signal waiting to enter
-                self.send_thread_message('writer', writer_id, 'enter', 'waiting')
-                
-                # Request write access
-                wait_time = self.rw_lock.writer_enter(writer_id)
-                
-                if wait_time > 0:
-                    self.log_message.emit(
-                        f"Writer {writer_id} waited {wait_time:.2f}s to enter",
-                        "DEBUG"
-                    )
-                
-                # Signal active writing
-                self.send_thread_message('writer', writer_id, 'write', 'active')
-                self.writer_active.emit(True)
-                
-                # Perform write operation
-                data = f"Data written by Writer {writer_id} at {time.time():.2f}"
                 result = self.database.write(writer_id, data, self.write_delay)
-                
+            except (RuntimeError, OSError) as e:
+                failures += 1
+                self._logger.error("Writer %d error: %s", writer_id, e)
+                _send('exit', 'completed')
+                if failures > self.MAX_WORKER_RETRIES:
+                    self._logger.error("Writer %d gave up after %d failed writes",
+                                       writer_id, failures)
+                    return
+            else:
+                failures = 0
                 # Signal completion
-                self.send_thread_message('writer', writer_id, 'exit', 'completed', result)
-                self.writer_active.emit(False)
-                
-                # Release write access
-                self.rw_lock.writer_exit()
-                
-                write_count += 1
-                
-                # Brief pause before next write attempt
-                time.sleep(0.5)
-                
-            except Exception as e:
-                self.log_message.emit(
-                    f"Writer {writer_id} error: {str(e)}",
-                    "ERROR"
-                )
-                break
+                _send('exit', 'completed', result)
+        finally:
+            # Release write access, even if the write failed
+            rw.writer_exit()
+        
+        # Brief pause before next write attempt; ends early on stop()
+        if self._shutdown_event.wait(0.5):
+            return
+        
+        self._resubmit(self.writer_worker, writer_id, run_id, failures)
     
     def stats_worker(self):
-        """Worker thread to periodically update statistics."""
-        update_interval = 0.1  # Update 10 times per second
+        """
+        Worker thread that pushes statistics when the lock state changes.
+        
+        Idle simulations emit nothing; under load emissions are capped at
+        ~30 Hz.
+        """
+        min_interval = 0.033  # Emit at most ~30 times per second
+        run_id = self._run_id
+        changed = self.rw_lock.stats_changed
+        _sleep = time.sleep
         
-        while self.running:
+        while self.running and run_id == self._run_id:
             try:
+                # Wait for a change; the timeout keeps stop() responsive
+                if not changed.wait(timeout=0.1):
+                    continue
+                changed.clear()
+                
                 # Get current statistics
                 stats = self.rw_lock.get_stats()
                 
-                # Add additional stats
-                db_stats = self.database.get_status()
-                stats.update({
-                    'database_accesses': db_stats['access_count'],
-                    'database_preview': db_stats['data_preview']
-                })
-                
                 # Check for deadlock
                 deadlock_msg = self.rw_lock.try_detect_deadlock()
                 if deadlock_msg:
-                    self.log_message.emit(deadlock_msg, "WARNING")
+                    self._logger.warning(deadlock_msg)
                 
                 # Emit signal for GUI update
-                self.status_update.emit(stats)
+                self.status_update.emit(
+                    stats['active_readers'],
+                    stats['waiting_readers'],
+                    stats['active_writers'],
+                    stats['waiting_writers'],
+                    stats['reads_completed'],
+                    stats['writes_completed'],
+                    stats['conflicts']
+                )
                 
-                # Sleep for update interval
-                time.sleep(update_interval)
+                # Rate cap; changes meanwhile are picked up next pass
+                _sleep(min_interval)
                 
             except Exception as e:
-                self.log_message.emit(f"Stats worker error: {str(e)}", "ERROR")
+                self._logger.error("Stats worker error: %s", e)
                 break
     
     def process_messages(self):
-        """Process messages from worker threads."""
-        while self.running:
+        """
+        Drain messages from worker threads.
+        
+        Runs on the GUI thread from a ~30 Hz timer. Every worker buffer is
+        emptied in one pass and a single thread_updates batch carries the
+        latest state of each thread, so no extra Python thread competes
+        with the workers for the interpreter.
+        """
+        latest: Dict[tuple, ThreadMessage] = {}
+        min_level = self.min_log_level
+        
+        # Forward records logged by worker threads; QueueHandler has
+        # already formatted each into record.msg
+        while True:
             try:
-                # Get message with timeout
-                message = self.message_queue.get(timeout=0.1)
-                
-                # Convert to dict for signal emission
-                message_dict = {
+                record = self._log_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.log_message.emit(record.msg,
+                                  _LEVEL_NAMES.get(record.levelno, LOG_INFO))
+        
+        try:
+            for key, buffer in self._worker_buffers.items():
+                while True:
+                    try:
+                        message = buffer.popleft()
+                    except IndexError:
+                        break
+                    
+                    # Later messages for the same thread replace earlier ones
+                    latest[key] = message
+                    
+                    # Log significant events
+                    if message.action in ['read', 'write']:
+                        level = LOG_DEBUG if message.status == 'active' else LOG_INFO
+                        if LOG_LEVELS[level] >= min_level:
+                            self.log_message.emit(
+                                f"{message.thread_type.title()} {message.thread_id} "
+                                f"{message.action} {message.status}",
+                                level
+                            )
+        except Exception as e:
+            self.log_message.emit(f"Message processor error: {str(e)}", LOG_ERROR)
+        
+        # Emit to GUI as one batch, converting only the surviving
+        # message of each thread to a dict
+        if latest:
+            self.thread_updates.emit([
+                {
                     'thread_type': message.thread_type,
                     'thread_id': message.thread_id,
                     'action': message.action,
@@ -342,27 +582,8 @@ class SimulationManager(QObject):
                     'data': message.data,
                     'timestamp': message.timestamp
                 }
-                
-                # Emit to GUI
-                self.thread_update.emit(message_dict)
-                
-                # Log significant events
-                if message.action in ['read', 'write']:
-                    level = "DEBUG" if message.status == 'active' else "INFO"
-                    self.log_message.emit(
-                        f"{message.thread_type.title()} {message.thread_id} "
-                        f"{message.action} {message.status}",
-                        level
-                    )
-                
-                # Mark task as done
-                self.message_queue.task_done()
-                
-            except queue.Empty:
-                continue
-            except Exception as e:
-                self.log_message.emit(f"Message processor error: {str(e)}", "ERROR")
-                break
+                for message in latest.values()
+            ])
     
     def send_thread_message(self, thread_type: str, thread_id: int,
                            action: str, status: str, data: Optional[str] = None):
@@ -370,14 +591,32 @@ class SimulationManager(QObject):
         Send a message from a worker thread to the GUI.
         
         This method is thread-safe and should be called from worker threads.
+        Messages go to the sending worker's own buffer; one from a worker
+        that start() did not register is dropped.
+        """
+        buffer = self._worker_buffers.get((thread_type, thread_id))
+        if buffer is not None:
+            buffer.append(
+                ThreadMessage(thread_type, thread_id, action, status, data))
+    
+    def reconfigure(self, num_readers: int, num_writers: int,
+                    read_delay: float, write_delay: float,
+                    writer_priority: bool):
         """
-        message = ThreadMessage(thread_type, thread_id, action, status, data)
+        Apply a full configuration, updating only the values that changed.
         
-        try:
-            self.message_queue.put(message, timeout=0.1)
-        except queue.Full:
-            # If queue is full, drop the message (shouldn't happen often)
-            pass
+        Delays and priority take effect immediately; thread counts apply
+        from the next start() or restart(), trimmed to MAX_POOL_WORKERS
+        in total.
+        """
+        self.update_configuration(
+            num_readers=num_readers if num_readers != self.num_readers else None,
+            num_writers=num_writers if num_writers != self.num_writers else None,
+            read_delay=read_delay if read_delay != self.read_delay else None,
+            write_delay=write_delay if write_delay != self.write_delay else None,
+            writer_priority=(writer_priority
+                             if writer_priority != self.writer_priority else None)
+        )
     
     def update_configuration(self, num_readers: Optional[int] = None,
                             num_writers: Optional[int] = None,
@@ -391,22 +630,25 @@ class SimulationManager(QObject):
         """
         if num_readers is not None:
             self.num_readers = num_readers
-            self.log_message.emit(f"Readers updated to {num_readers}", "INFO")
+            self.log_message.emit(f"Readers updated to {num_readers}", LOG_INFO)
         
         if num_writers is not None:
             self.num_writers = num_writers
-            self.log_message.emit(f"Writers updated to {num_writers}", "INFO")
+            self.log_message.emit(f"Writers updated to {num_writers}", LOG_INFO)
+        
+        if num_readers is not None or num_writers is not None:
+            self._clamp_thread_counts()
         
         if read_delay is not None:
             self.read_delay = read_delay
-            self.log_message.emit(f"Read delay updated to {read_delay}s", "INFO")
+            self.log_message.emit(f"Read delay updated to {read_delay}s", LOG_INFO)
         
         if write_delay is not None:
             self.write_delay = write_delay
-            self.log_message.emit(f"Write delay updated to {write_delay}s", "INFO")
+            self.log_message.emit(f"Write delay updated to {write_delay}s", LOG_INFO)
         
         if writer_priority is not None:
             self.writer_priority = writer_priority
             self.rw_lock.set_priority(writer_priority)
             mode = "Writer Priority" if writer_priority else "Reader Priority"
-            self.log_message.emit(f"Priority mode changed to {mode}", "INFO")
\ No newline at end of file
+            self.log_message.emit(f"Priority mode changed to {mode}", LOG_INFO)
\ No newline at end of file
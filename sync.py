@@ -4,10 +4,25 @@ Implements both reader-priority and writer-priority solutions
 """
 import threading
 import time
-from typing import Optional
+from typing import Callable, List, Optional
 from collections import deque
 
 
+# Monotonic clock for wait-time measurement; unaffected by wall-clock changes
+_now = time.monotonic
+
+
+class _ThreadCounters:
+    """Completion and conflict counts owned by a single thread."""
+    
+    __slots__ = ('reads', 'writes', 'conflicts')
+    
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+        self.conflicts = 0
+
+
 class ReaderWriterLock:
     """
     Implementation of Readers-Writers lock with configurable priority.
@@ -32,203 +47,245 @@ class ReaderWriterLock:
         """
         self.writer_priority = writer_priority
         
-        # Counter for active readers
-        self.readers_count = 0
-        
-        # Mutex to protect readers_count
-        self.readers_count_mutex = threading.Lock()
-        
-        # Semaphore for writers (binary semaphore for exclusive write access)
-        self.writers_mutex = threading.Semaphore(1)
-        
-        # Semaphore to control access when writers have priority
-        self.read_try = threading.Semaphore(1)
+        # Single mutex guarding all lock state below
+        self._mutex = threading.Lock()
         
-        # Condition variable for waiting threads
-        self.condition = threading.Condition()
+        # Condition variables for waiting readers and writers
+        self._readers_cv = threading.Condition(self._mutex)
+        self._writers_cv = threading.Condition(self._mutex)
         
         # Queues for waiting threads (for fairness)
         self.reader_queue = deque()
         self.writer_queue = deque()
         
-        # Statistics
+        # State and statistics
         self.active_readers = 0
         self.active_writers = 0
         self.waiting_readers = 0
         self.waiting_writers = 0
-        self.reads_completed = 0
-        self.writes_completed = 0
-        self.conflicts = 0
         
-        # For deadlock prevention
-        self.deadlock_detection_lock = threading.Lock()
+        # Completed/conflict counts are sharded per thread and summed on
+        # read, so incrementing them needs no shared lock. The lock below
+        # is only taken when a thread registers its shard
+        self._per_tid = threading.local()
+        self._all_counters: List[_ThreadCounters] = []
+        self._counters_lock = threading.Lock()
+        
+        # Set whenever the counters above change, for the stats poller
+        self.stats_changed = threading.Event()
+        
+        # Optional callbacks for when reading/writing starts (True) or
+        # stops (False) overall: called on the 0->1 and 1->0 transitions
+        # of the active counts, under the mutex so calls stay ordered
+        self.on_reader_active: Optional[Callable[[bool], None]] = None
+        self.on_writer_active: Optional[Callable[[bool], None]] = None
         
     def reader_enter(self, reader_id: int):
         """
         Reader attempts to enter critical section.
         
         Reader-priority algorithm:
-        1. Wait for writer to finish (read_try semaphore)
-        2. Increment readers count (protected by mutex)
-        3. If first reader, acquire writers_mutex to block writers
+        1. Wait while a writer is active
+        2. Increment active readers (writers wait until it drops to 0)
         
         Writer-priority algorithm:
-        1. Acquire read_try to prevent new readers
-        2. Check if writers are waiting
-        3. If no writers, proceed like reader-priority
+        1. Wait while a writer is active or any writer is waiting
+        2. Proceed like reader-priority
         """
-        start_time = time.time()
+        start_time = _now()
+        counters = self._counters()
         
-        if self.writer_priority:
-            # Writer-priority implementation
-            with self.condition:
+        with self._mutex:
+            if self._reader_blocked():
                 self.waiting_readers += 1
-                
-            # Acquire read_try to prevent new readers when writers arrive
-            self.read_try.acquire()
-            
-            with self.condition:
+                self.stats_changed.set()
+                while self._reader_blocked():
+                    self._readers_cv.wait()
                 self.waiting_readers -= 1
+            self.active_readers += 1
+            if self.active_readers == 1:
+                self._notify_active(self.on_reader_active, True)
             
-            # Check if writers are waiting
-            with self.condition:
-                while self.waiting_writers > 0:
-                    self.conflicts += 1
-                    self.condition.wait()
-            
-            with self.readers_count_mutex:
-                self.readers_count += 1
-                if self.readers_count == 1:
-                    # First reader blocks writers
-                    self.writers_mutex.acquire()
-            
-            self.read_try.release()
-            
-        else:
-            # Reader-priority implementation (original solution)
-            # Prevent writers from acquiring lock while readers are active
-            self.read_try.acquire()
-            
-            with self.readers_count_mutex:
-                self.readers_count += 1
-                if self.readers_count == 1:
-                    # First reader blocks writers
-                    self.writers_mutex.acquire()
+            # A blocked entry counts as one conflict, by time, as for writers
+            wait_time = _now() - start_time
+            if wait_time > 0.1:  # If waited more than 100ms, log as conflict
+                counters.conflicts += 1
+            self.stats_changed.set()
             
-            self.read_try.release()
+        return wait_time
+    
+    def try_reader_enter(self, reader_id: int) -> bool:
+        """
+        Enter as a reader only if no wait is needed.
         
-        with self.condition:
+        Returns True if the reader entered, False if reader_enter would
+        have blocked (nothing is changed in that case).
+        """
+        with self._mutex:
+            if self._reader_blocked():
+                return False
             self.active_readers += 1
-        
-        wait_time = time.time() - start_time
-        if wait_time > 0.1:  # If waited more than 100ms, log as conflict
-            self.conflicts += 1
-            
-        return wait_time
+            if self.active_readers == 1:
+                self._notify_active(self.on_reader_active, True)
+            self.stats_changed.set()
+        return True
+    
+    @staticmethod
+    def _notify_active(callback: Optional[Callable[[bool], None]], active: bool):
+        """Invoke an activity callback if one is set (caller holds the mutex)."""
+        if callback is not None:
+            callback(active)
+    
+    def _counters(self) -> _ThreadCounters:
+        """Return the calling thread's counter shard, creating it once."""
+        counters = getattr(self._per_tid, 'counters', None)
+        if counters is None:
+            counters = self._per_tid.counters = _ThreadCounters()
+            with self._counters_lock:
+                self._all_counters.append(counters)
+        return counters
+    
+    @property
+    def reads_completed(self) -> int:
+        """Total reads completed across all threads."""
+        return sum(c.reads for c in self._all_counters)
+    
+    @property
+    def writes_completed(self) -> int:
+        """Total writes completed across all threads."""
+        return sum(c.writes for c in self._all_counters)
+    
+    @property
+    def conflicts(self) -> int:
+        """Total conflicts seen across all threads."""
+        return sum(c.conflicts for c in self._all_counters)
+    
+    def _reader_blocked(self) -> bool:
+        """Whether a reader must wait (caller holds the mutex)."""
+        return (self.active_writers > 0 or
+                (self.writer_priority and self.waiting_writers > 0))
     
     def reader_exit(self):
         """Reader leaves critical section."""
-        with self.readers_count_mutex:
-            self.readers_count -= 1
-            if self.readers_count == 0:
-                # Last reader releases writers lock
-                self.writers_mutex.release()
+        self._counters().reads += 1
         
-        with self.condition:
+        with self._mutex:
             self.active_readers -= 1
-            self.reads_completed += 1
-            # Notify waiting writers if no more readers
-            if self.readers_count == 0:
-                self.condition.notify_all()
+            if self.active_readers == 0:
+                self._notify_active(self.on_reader_active, False)
+            self.stats_changed.set()
+            # Last reader lets one waiting writer in
+            if self.active_readers == 0 and self.waiting_writers > 0:
+                self._writers_cv.notify()
     
     def writer_enter(self, writer_id: int):
         """
         Writer attempts to enter critical section.
         
         Writer needs exclusive access:
-        1. Acquire writers_mutex (blocks other writers)
-        2. For writer-priority: also prevent new readers
+        1. Wait until no reader or writer is active
+        2. For writer-priority: waiting writers also hold off new readers
         """
-        start_time = time.time()
+        start_time = _now()
+        counters = self._counters()
         
-        if self.writer_priority:
-            # Writer-priority implementation
-            with self.condition:
-                self.waiting_writers += 1
-            
-            # Prevent new readers from starting
-            self.read_try.acquire()
-            
-            # Acquire exclusive write lock
-            self.writers_mutex.acquire()
-            
-            with self.condition:
-                self.waiting_writers -= 1
-                self.active_writers += 1
-            
-            self.read_try.release()
-            
-        else:
-            # Reader-priority implementation
-            # Just acquire exclusive write lock
-            with self.condition:
-                self.waiting_writers += 1
-            
-            self.writers_mutex.acquire()
+        with self._mutex:
+            self.waiting_writers += 1
+            self.stats_changed.set()
+            while self.active_writers > 0 or self.active_readers > 0:
+                self._writers_cv.wait()
+            self.waiting_writers -= 1
+            self.active_writers += 1
+            self._notify_active(self.on_writer_active, True)
             
-            with self.condition:
-                self.waiting_writers -= 1
-                self.active_writers += 1
-        
-        wait_time = time.time() - start_time
-        if wait_time > 0.1:  # If waited more than 100ms, log as conflict
-            self.conflicts += 1
+            wait_time = _now() - start_time
+            if wait_time > 0.1:  # If waited more than 100ms, log as conflict
+                counters.conflicts += 1
+            self.stats_changed.set()
             
         return wait_time
     
+    def try_writer_enter(self, writer_id: int) -> bool:
+        """
+        Enter as a writer only if no wait is needed.
+        
+        Returns True if the writer entered, False if writer_enter would
+        have blocked (nothing is changed in that case).
+        """
+        with self._mutex:
+            if self.active_writers > 0 or self.active_readers > 0:
+                return False
+            self.active_writers += 1
+            self._notify_active(self.on_writer_active, True)
+            self.stats_changed.set()
+        return True
+    
     def writer_exit(self):
         """Writer leaves critical section."""
-        self.writers_mutex.release()
+        self._counters().writes += 1
         
-        with self.condition:
+        with self._mutex:
             self.active_writers -= 1
-            self.writes_completed += 1
-            # Notify all waiting threads
-            self.condition.notify_all()
+            self._notify_active(self.on_writer_active, False)
+            self.stats_changed.set()
+            # Hand off to the side that has priority, if anyone is waiting.
+            # Only one writer can proceed, so writers are woken singly;
+            # readers can all enter together
+            if self.writer_priority:
+                if self.waiting_writers > 0:
+                    self._writers_cv.notify()
+                elif self.waiting_readers > 0:
+                    self._readers_cv.notify_all()
+            else:
+                if self.waiting_readers > 0:
+                    self._readers_cv.notify_all()
+                elif self.waiting_writers > 0:
+                    self._writers_cv.notify()
     
     def get_stats(self) -> dict:
-        """Get current synchronization statistics."""
-        with self.condition:
-            return {
-                'active_readers': self.active_readers,
-                'active_writers': self.active_writers,
-                'waiting_readers': self.waiting_readers,
-                'waiting_writers': self.waiting_writers,
-                'reads_completed': self.reads_completed,
-                'writes_completed': self.writes_completed,
-                'conflicts': self.conflicts
-            }
+        """
+        Get current synchronization statistics.
+        
+        Counters are only written under the mutex or by their owning
+        thread, but read here without locking: each int read is atomic
+        under the GIL, so the stats poller never blocks enter/exit.
+        Fields may be momentarily inconsistent with each other, which is
+        fine for a monitoring display. Free-threaded builds would need a
+        short locked snapshot instead.
+        """
+        return {
+            'active_readers': self.active_readers,
+            'active_writers': self.active_writers,
+            'waiting_readers': self.waiting_readers,
+            'waiting_writers': self.waiting_writers,
+            'reads_completed': self.reads_completed,
+            'writes_completed': self.writes_completed,
+            'conflicts': self.conflicts
+        }
     
     def set_priority(self, writer_priority: bool):
         """Change priority mode at runtime."""
-        # Note: This is a simplified implementation
-        # In production, we'd need to safely transition
-        self.writer_priority = writer_priority
+        with self._mutex:
+            self.writer_priority = writer_priority
+            # Waiters re-check their predicate under the new policy
+            self._readers_cv.notify_all()
+            self._writers_cv.notify_all()
         
     def try_detect_deadlock(self) -> Optional[str]:
         """
         Simple deadlock detection.
         Returns error message if deadlock suspected, None otherwise.
+        
+        Reads the counters lock-free, like get_stats.
         """
-        with self.deadlock_detection_lock:
-            # Check for potential deadlock conditions
-            if (self.active_writers > 0 and self.active_readers > 0):
-                return "Deadlock detected: Both readers and writers active"
-            
-            if (self.waiting_writers > 5 and self.waiting_readers > 5):
-                return "Potential starvation: Many threads waiting"
-            
-            return None
+        # Check for potential deadlock conditions
+        if (self.active_writers > 0 and self.active_readers > 0):
+            return "Deadlock detected: Both readers and writers active"
+        
+        if (self.waiting_writers > 5 and self.waiting_readers > 5):
+            return "Potential starvation: Many threads waiting"
+        
+        return None
 
 
 class FairReaderWriterLock:
@@ -265,7 +322,7 @@ class FairReaderWriterLock:
         """Reader exits."""
         with self.mutex:
             self.readers_count -= 1
-            if self.readers_count == 0:
+            if self.readers_count == 0 and self.waiting_writers > 0:
                 self.writers_condition.notify()
     
     def writer_enter(self, writer_id: int):
@@ -284,7 +341,7 @@ class FairReaderWriterLock:
             self.writer_active = False
             if self.waiting_readers > 0:
                 self.readers_condition.notify_all()
-            else:
+            elif self.waiting_writers > 0:
                 self.writers_condition.notify()
 
 
@@ -297,9 +354,25 @@ class DatabaseSimulator:
     configurable delays.
     """
     
-    def __init__(self, initial_data: str = "Initial Database Content"):
-        """Initialize database with initial content."""
+    # How the delay of an operation is spent
+    WORK_MODES = ('sleep', 'hash')
+    
+    def __init__(self, initial_data: str = "Initial Database Content",
+                 work_mode: str = 'sleep'):
+        """
+        Initialize database with initial content.
+        
+        Args:
+            initial_data: Starting database content
+            work_mode: 'sleep' waits out each delay (default); 'hash' spends
+                       it hashing the data, so operations compete for CPU
+        """
+        if work_mode not in self.WORK_MODES:
+            raise ValueError(f"Unknown work mode: {work_mode}")
+        self.work_mode = work_mode
         self.data = initial_data
+        # First 50 characters of data, refreshed on every write
+        self._data_preview = initial_data[:50]
         self.access_count = 0
         self.data_mutex = threading.Lock()
         
@@ -318,12 +391,15 @@ class DatabaseSimulator:
             Current database content
         """
         # Simulate reading time
-        time.sleep(delay)
+        self._simulate_work(delay)
         
         with self.data_mutex:
             self.access_count += 1
-            return f"[Reader {reader_id}] Read: {self.data[:50]}..." \
-                   f" (Access #{self.access_count})"
+            count = self.access_count
+            preview = self._data_preview
+        
+        return f"[Reader {reader_id}] Read: {preview}..." \
+               f" (Access #{count})"
     
     def write(self, writer_id: int, new_data: str, delay: float = 2.0) -> str:
         """
@@ -341,19 +417,41 @@ class DatabaseSimulator:
             Confirmation message
         """
         # Simulate writing time
-        time.sleep(delay)
+        self._simulate_work(delay)
+        
+        preview = new_data[:50]
         
         with self.data_mutex:
             self.data = new_data
+            self._data_preview = preview
             self.access_count += 1
-            return f"[Writer {writer_id}] Wrote: {new_data[:50]}..." \
-                   f" (Access #{self.access_count})"
+            count = self.access_count
+        
+        return f"[Writer {writer_id}] Wrote: {preview}..." \
+               f" (Access #{count})"
+    
+    def _simulate_work(self, delay: float):
+        """Spend delay seconds according to the work mode."""
+        if self.work_mode == 'sleep':
+            time.sleep(delay)
+            return
+        
+        # CPU-bound stand-in for real work
+        end = _now() + delay
+        data = self.data
+        h = 0
+        while _now() < end:
+            h = hash((h, data))
     
     def get_status(self) -> dict:
         """Get current database status."""
         with self.data_mutex:
-            return {
-                'data_preview': self.data[:50] + "..." if len(self.data) > 50 else self.data,
-                'access_count': self.access_count,
-                'data_length': len(self.data)
-            }
\ No newline at end of file
+            data = self.data
+            preview = self._data_preview
+            count = self.access_count
+        
+        return {
+            'data_preview': preview + "..." if len(data) > 50 else data,
+            'access_count': count,
+            'data_length': len(data)
+        }
\ No newline at end of file
@@ -2,14 +2,125 @@
 Visualization components for the simulation
 Custom Qt widgets for animated visualization of threads and resource access
 """
-from typing import Dict, List, Optional
+from collections import deque
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 import math
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QProgressBar, QGroupBox, QFrame)
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QRectF
+from PyQt6.QtCore import (Qt, QTimer, QPropertyAnimation, QEasingCurve, QRectF,
+                          QPointF, QLineF, QRect, QCoreApplication)
 from PyQt6.QtGui import (QPainter, QColor, QPen, QBrush, QFont, QLinearGradient,
-                        QPainterPath, QFontMetrics, QRadialGradient)
+                        QFontMetrics, QRadialGradient, QPixmap,
+                        QPixmapCache, QPolygonF, QGradient)
+
+from visuals_palette import COLORS, PALETTE, PENS, cached_pen
+
+
+# Period of the shared animation clock. The resource visualizer animates
+# on every tick, thread pulses on every 2nd and progress on every 4th
+ANIMATION_TICK_MS = 25
+
+_animation_clock: Optional[QTimer] = None
+_animation_subscribers = 0
+
+# Unit-circle (cos, sin) of each gear tooth tip and the notch after it
+_GEAR_TEETH = 8
+_GEAR_COS_SIN = [
+    (math.cos(2 * math.pi * i / _GEAR_TEETH),
+     math.sin(2 * math.pi * i / _GEAR_TEETH),
+     math.cos(2 * math.pi * (i + 0.5) / _GEAR_TEETH),
+     math.sin(2 * math.pi * (i + 0.5) / _GEAR_TEETH))
+    for i in range(_GEAR_TEETH)
+]
+
+
+# Pulse phase is an index into one turn of _PULSE_STEPS; each animation step
+# advances it by _PULSE_STEP (~0.1 rad) and |sin| is read from the table
+_PULSE_STEPS = 256
+_PULSE_STEP = 4
+_ABS_SIN_LUT = [abs(math.sin(2 * math.pi * i / _PULSE_STEPS))
+                for i in range(_PULSE_STEPS)]
+
+
+@lru_cache(maxsize=None)
+def _unit_circle(points: int) -> Tuple[Tuple[float, float], ...]:
+    """(cos, sin) of points evenly spaced around the circle, from angle 0."""
+    step = 2 * math.pi / points
+    return tuple((math.cos(i * step), math.sin(i * step))
+                 for i in range(points))
+
+
+# Group box styles for the thread sections, by accent color
+_GROUP_QSS_TEMPLATE = """
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid %(color)s;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: %(color)s;
+    }
+"""
+_READER_GROUP_QSS = _GROUP_QSS_TEMPLATE % {'color': '#4CAF50'}
+_WRITER_GROUP_QSS = _GROUP_QSS_TEMPLATE % {'color': '#f44336'}
+
+
+class AccessType(IntEnum):
+    """Kind of the latest resource access; indexes per-type paint tables."""
+    WRITER = 0
+    READER = 1
+    CONFLICT = 2
+
+
+def _bounding_radial_brush(*stops) -> QBrush:
+    """Radial gradient brush that scales to whatever shape it fills."""
+    gradient = QRadialGradient(0.5, 0.5, 0.5)
+    gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+    for position, color in stops:
+        gradient.setColorAt(position, color)
+    return QBrush(gradient)
+
+
+def animation_clock() -> QTimer:
+    """
+    Return the single timer that drives all visualizer animation.
+    
+    Visualizers attach through subscribe_animation/unsubscribe_animation,
+    which keep the timer running only while something is subscribed.
+    """
+    global _animation_clock
+    if _animation_clock is None:
+        _animation_clock = QTimer(QCoreApplication.instance())
+        _animation_clock.setInterval(ANIMATION_TICK_MS)
+    return _animation_clock
+
+
+def subscribe_animation(slot):
+    """Connect slot to the animation clock, starting it for the first one."""
+    global _animation_subscribers
+    clock = animation_clock()
+    clock.timeout.connect(slot)
+    _animation_subscribers += 1
+    if _animation_subscribers == 1:
+        clock.start()
+
+
+def unsubscribe_animation(slot):
+    """Disconnect slot; the clock stops once nothing is subscribed."""
+    global _animation_subscribers
+    clock = animation_clock()
+    clock.timeout.disconnect(slot)
+    _animation_subscribers -= 1
+    if _animation_subscribers == 0:
+        clock.stop()
 
 
 class ThreadWidget(QWidget):
@@ -37,6 +148,12 @@ class ThreadWidget(QWidget):
         }
     }
     
+    # Pulse ring per animated status: (phase speed, amplitude, pen width)
+    PULSES = {
+        'waiting': (1, 5, 2),
+        'active': (2, 3, 3),
+    }
+    
     def __init__(self, thread_id: int, thread_type: str, parent=None):
         """Initialize thread widget."""
         super().__init__(parent)
@@ -46,71 +163,161 @@ class ThreadWidget(QWidget):
         self.status = 'idle'
         self.action = ''
         self.progress = 0
-        self.pulse_value = 0
-        
-        # Animation timer
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self.update_pulse)
-        self.animation_timer.start(50)  # 20 FPS
+        self.pulse_index = 0
+        
+        # Colors for this thread type, looked up once
+        self._colors = self.COLORS[thread_type]
+        self._border_color = self._colors['border']
+        
+        # Body painters by status; anything unknown draws as idle
+        self._draw_fns = {
+            'waiting': self.draw_waiting_thread,
+            'active': self.draw_active_thread,
+            'completed': self.draw_completed_thread,
+            'idle': self.draw_idle_thread,
+        }
         
         # Size
         self.setMinimumSize(80, 100)
         self.setMaximumSize(120, 140)
         
-        # Font
+        # Regions repainted on their own; recomputed on resize
+        self._icon_rect = QRect()
+        self._progress_rect = QRect()
+        self._info_rect = QRect()
+        self._update_rects()
+        
+        # Fonts
         self.font = QFont()
         self.font.setBold(True)
+        self._status_font = QFont()
+        self._status_font.setPointSize(8)
         
     def update_status(self, status: str, action: str = ''):
-        """Update thread status and action."""
+        """Update thread status and action, repainting only on a change."""
+        if status == self.status and action == self.action:
+            return
         self.status = status
         self.action = action
         self.update()
         
     def set_progress(self, progress: float):
-        """Set operation progress (0.0 to 1.0)."""
-        self.progress = max(0.0, min(1.0, progress))
-        self.update()
+        """Set operation progress (0.0 to 1.0), repainting only visible changes."""
+        progress = max(0.0, min(1.0, progress))
+        bar_width = self.width() - 20
+        changed = int(bar_width * progress) != int(bar_width * self.progress)
+        self.progress = progress
+        if changed:
+            self.update(self._progress_rect)
         
     def update_pulse(self):
-        """Update pulse animation for waiting/active threads."""
-        if self.status in ['waiting', 'active']:
-            self.pulse_value = (self.pulse_value + 0.1) % (2 * math.pi)
-            self.update()
+        """
+        Update pulse animation for waiting/active threads.
+        
+        Called by ThreadVisualizer's animation tick.
+        """
+        if self.status in self.PULSES:
+            self.pulse_index = (self.pulse_index + _PULSE_STEP) % _PULSE_STEPS
+            self.update(self._icon_rect)
+        
+    def _update_rects(self):
+        """Compute the bounding rects of the icon, progress bar and text."""
+        width = self.width()
+        height = self.height()
+        
+        # Icon at its largest pulse, plus room for the pen and antialiasing
+        center_x = width // 2
+        center_y = height // 2 - 10
+        max_radius = min(width, height) // 3 - 5 + 5 + 3
+        self._icon_rect = QRect(center_x - max_radius, center_y - max_radius,
+                                max_radius * 2, max_radius * 2)
+        
+        self._progress_rect = QRect(10, height - 41, width - 20, 8)
+        self._info_rect = QRect(0, height - 30, width, 40)
+        
+    def resizeEvent(self, event):
+        """Recompute the partial repaint regions for the new size."""
+        super().resizeEvent(event)
+        self._update_rects()
         
     def paintEvent(self, event):
-        """Paint the thread widget."""
+        """Paint the parts of the thread widget inside the exposed rect."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Idle and completed frames only blit the pre-rendered body and draw
+        # text; antialiasing is needed just for the pulse ring and progress bar
+        if self.status in self.PULSES:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Get widget dimensions
         width = self.width()
         height = self.height()
+        exposed = event.rect()
         
-        # Get colors based on thread type and status
-        colors = self.COLORS[self.thread_type]
-        base_color = colors.get(self.status, colors['idle'])
-        border_color = colors['border']
-        
-        # Draw thread representation based on status
-        if self.status == 'waiting':
-            self.draw_waiting_thread(painter, width, height, base_color, border_color)
-        elif self.status == 'active':
-            self.draw_active_thread(painter, width, height, base_color, border_color)
-        elif self.status == 'completed':
-            self.draw_completed_thread(painter, width, height, base_color, border_color)
-        else:
-            self.draw_idle_thread(painter, width, height, base_color, border_color)
+        if exposed.intersects(self._icon_rect):
+            # Blit the static body, then overlay the pulse ring, the only
+            # part that changes between animation frames
+            painter.drawPixmap(0, 0, self._icon_pixmap(width, height))
+            
+            pulse_params = self.PULSES.get(self.status)
+            if pulse_params is not None:
+                speed, amplitude, pen_width = pulse_params
+                pulse = _ABS_SIN_LUT[self.pulse_index * speed % _PULSE_STEPS] * amplitude
+                self.draw_pulse_ring(painter, width, height, self._border_color,
+                                     pulse, pen_width)
         
         # Draw thread info
-        self.draw_thread_info(painter, width, height)
+        if exposed.intersects(self._info_rect):
+            self.draw_thread_info(painter, width, height)
         
         # Draw progress bar for active operations
-        if self.status == 'active' and self.progress > 0:
+        if (self.status == 'active' and self.progress > 0 and
+                exposed.intersects(self._progress_rect)):
             self.draw_progress_bar(painter, width, height)
         
         painter.end()
         
+    def _icon_pixmap(self, width: int, height: int) -> QPixmap:
+        """
+        Return the body for the current status, rendered once per size.
+        
+        Bodies are shared by all thread widgets through QPixmapCache, which
+        bounds them, so sizes passed through while resizing are evicted.
+        """
+        dpr = self.devicePixelRatioF()
+        key = f"thread_icon_{self.thread_type}_{self.status}_{width}x{height}@{dpr}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+        
+        pixmap = QPixmap(int(width * dpr), int(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw thread representation based on status
+        base_color = self._colors.get(self.status, self._colors['idle'])
+        draw = self._draw_fns.get(self.status, self.draw_idle_thread)
+        draw(painter, width, height, base_color, self._border_color)
+        
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+        
+    def draw_pulse_ring(self, painter: QPainter, width: int, height: int,
+                        border_color: QColor, pulse: float, pen_width: int):
+        """Draw the animated outline pulse radius pixels outside the body."""
+        if pulse <= 0:
+            return
+        center_x = width // 2
+        center_y = height // 2 - 10
+        radius = min(width, height) // 3 - 5 + pulse
+        
+        painter.setBrush(PALETTE['none'])
+        painter.setPen(cached_pen(border_color, pen_width))
+        painter.drawEllipse(QPointF(center_x, center_y), radius, radius)
+        
     def draw_idle_thread(self, painter: QPainter, width: int, height: int, 
                         color: QColor, border_color: QColor):
         """Draw idle thread representation."""
@@ -125,9 +332,8 @@ class ThreadWidget(QWidget):
         gradient.setColorAt(1, color.darker(150))
         
         painter.setBrush(QBrush(gradient))
-        painter.setPen(QPen(border_color, 2))
-        painter.drawEllipse(center_x - radius, center_y - radius, 
-                           radius * 2, radius * 2)
+        painter.setPen(cached_pen(border_color, 2))
+        painter.drawEllipse(QPointF(center_x, center_y), radius, radius)
         
         # Draw thread symbol inside
         symbol = "R" if self.thread_type == 'reader' else "W"
@@ -137,14 +343,10 @@ class ThreadWidget(QWidget):
         
     def draw_waiting_thread(self, painter: QPainter, width: int, height: int,
                            color: QColor, border_color: QColor):
-        """Draw waiting thread with pulsing animation."""
+        """Draw waiting thread body; the pulse is drawn per frame on top."""
         center_x = width // 2
         center_y = height // 2 - 10
-        base_radius = min(width, height) // 3 - 5
-        
-        # Calculate pulse radius
-        pulse = abs(math.sin(self.pulse_value)) * 5
-        radius = base_radius + pulse
+        radius = min(width, height) // 3 - 5
         
         # Create pulsing gradient
         gradient = QRadialGradient(center_x, center_y, radius)
@@ -153,39 +355,33 @@ class ThreadWidget(QWidget):
         gradient.setColorAt(1, color.darker(150))
         
         painter.setBrush(QBrush(gradient))
-        painter.setPen(QPen(border_color, 2))
-        painter.drawEllipse(center_x - radius, center_y - radius,
-                           radius * 2, radius * 2)
+        painter.setPen(cached_pen(border_color, 2))
+        painter.drawEllipse(QPointF(center_x, center_y), radius, radius)
         
         # Draw waiting symbol (hourglass)
-        painter.setPen(QPen(Qt.GlobalColor.white, 2))
+        painter.setPen(PENS['icon'])
         hourglass_size = radius * 0.6
         self.draw_hourglass(painter, center_x, center_y, hourglass_size)
         
     def draw_active_thread(self, painter: QPainter, width: int, height: int,
                           color: QColor, border_color: QColor):
-        """Draw active thread with animation."""
+        """Draw active thread body; the pulse is drawn per frame on top."""
         center_x = width // 2
         center_y = height // 2 - 10
-        base_radius = min(width, height) // 3 - 5
-        
-        # Calculate animation
-        pulse = abs(math.sin(self.pulse_value * 2)) * 3
-        radius = base_radius + pulse
+        radius = min(width, height) // 3 - 5
         
         # Create active gradient
         gradient = QRadialGradient(center_x, center_y, radius)
-        gradient.setColorAt(0, QColor(255, 255, 255))
+        gradient.setColorAt(0, COLORS['white'])
         gradient.setColorAt(0.3, color.lighter(150))
         gradient.setColorAt(1, color.darker(100))
         
         painter.setBrush(QBrush(gradient))
-        painter.setPen(QPen(border_color, 3))
-        painter.drawEllipse(center_x - radius, center_y - radius,
-                           radius * 2, radius * 2)
+        painter.setPen(cached_pen(border_color, 3))
+        painter.drawEllipse(QPointF(center_x, center_y), radius, radius)
         
         # Draw active symbol (gear)
-        painter.setPen(QPen(Qt.GlobalColor.white, 2))
+        painter.setPen(PENS['icon'])
         gear_size = radius * 0.7
         self.draw_gear(painter, center_x, center_y, gear_size)
         
@@ -202,12 +398,11 @@ class ThreadWidget(QWidget):
         gradient.setColorAt(1, color.darker(100))
         
         painter.setBrush(QBrush(gradient))
-        painter.setPen(QPen(border_color, 2))
-        painter.drawEllipse(center_x - radius, center_y - radius,
-                           radius * 2, radius * 2)
+        painter.setPen(cached_pen(border_color, 2))
+        painter.drawEllipse(QPointF(center_x, center_y), radius, radius)
         
         # Draw checkmark
-        painter.setPen(QPen(Qt.GlobalColor.white, 3))
+        painter.setPen(PENS['icon_thick'])
         check_size = radius * 0.7
         self.draw_checkmark(painter, center_x, center_y, check_size)
         
@@ -221,9 +416,7 @@ class ThreadWidget(QWidget):
                         Qt.AlignmentFlag.AlignCenter, id_text)
         
         # Draw status
-        status_font = QFont()
-        status_font.setPointSize(8)
-        painter.setFont(status_font)
+        painter.setFont(self._status_font)
         
         status_text = self.status.capitalize()
         if self.action:
@@ -241,15 +434,15 @@ class ThreadWidget(QWidget):
         
         # Draw background
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QBrush(QColor(200, 200, 200, 150)))
+        painter.setBrush(PALETTE['progress_track'])
         painter.drawRoundedRect(bar_x, bar_y, bar_width, bar_height, 3, 3)
         
         # Draw progress
         progress_width = int(bar_width * self.progress)
         if progress_width > 0:
             gradient = QLinearGradient(bar_x, bar_y, bar_x + progress_width, bar_y)
-            gradient.setColorAt(0, QColor(76, 175, 80))
-            gradient.setColorAt(1, QColor(56, 142, 60))
+            gradient.setColorAt(0, COLORS['progress_start'])
+            gradient.setColorAt(1, COLORS['progress_end'])
             
             painter.setBrush(QBrush(gradient))
             painter.drawRoundedRect(bar_x, bar_y, progress_width, bar_height, 3, 3)
@@ -257,64 +450,33 @@ class ThreadWidget(QWidget):
     def draw_hourglass(self, painter: QPainter, x: int, y: int, size: float):
         """Draw hourglass symbol for waiting state."""
         half_size = size / 2
+        left = QPointF(x - half_size * 0.7, y)
+        right = QPointF(x + half_size * 0.7, y)
         
-        # Draw top triangle
-        top_path = QPainterPath()
-        top_path.moveTo(x, y - half_size)
-        top_path.lineTo(x - half_size * 0.7, y)
-        top_path.lineTo(x + half_size * 0.7, y)
-        top_path.closeSubpath()
-        painter.drawPath(top_path)
-        
-        # Draw bottom triangle
-        bottom_path = QPainterPath()
-        bottom_path.moveTo(x, y + half_size)
-        bottom_path.lineTo(x - half_size * 0.7, y)
-        bottom_path.lineTo(x + half_size * 0.7, y)
-        bottom_path.closeSubpath()
-        painter.drawPath(bottom_path)
+        # Draw top and bottom triangles
+        painter.drawPolygon(QPolygonF([QPointF(x, y - half_size), left, right]))
+        painter.drawPolygon(QPolygonF([QPointF(x, y + half_size), left, right]))
         
     def draw_gear(self, painter: QPainter, x: int, y: int, size: float):
         """Draw gear symbol for active state."""
-        teeth = 8
         inner_radius = size * 0.4
         outer_radius = size * 0.6
         
-        path = QPainterPath()
-        
-        for i in range(teeth):
-            angle = 2 * math.pi * i / teeth
-            next_angle = 2 * math.pi * (i + 0.5) / teeth
-            
-            # Outer point
-            ox = x + outer_radius * math.cos(angle)
-            oy = y + outer_radius * math.sin(angle)
-            
-            # Inner point
-            ix = x + inner_radius * math.cos(next_angle)
-            iy = y + inner_radius * math.sin(next_angle)
-            
-            if i == 0:
-                path.moveTo(ox, oy)
-            else:
-                path.lineTo(ox, oy)
-                
-            path.lineTo(ix, iy)
-            
-        path.closeSubpath()
-        painter.drawPath(path)
+        # Alternate outer tooth tips and inner notches from the unit table
+        points = []
+        for cos_o, sin_o, cos_i, sin_i in _GEAR_COS_SIN:
+            points.append(QPointF(x + outer_radius * cos_o, y + outer_radius * sin_o))
+            points.append(QPointF(x + inner_radius * cos_i, y + inner_radius * sin_i))
+        painter.drawPolygon(QPolygonF(points))
         
     def draw_checkmark(self, painter: QPainter, x: int, y: int, size: float):
         """Draw checkmark symbol for completed state."""
-        path = QPainterPath()
-        
-        # Draw checkmark
         offset = size * 0.2
-        path.moveTo(x - size / 2 + offset, y)
-        path.lineTo(x - offset, y + size / 2 - offset)
-        path.lineTo(x + size / 2 - offset, y - size / 2 + offset)
-        
-        painter.drawPath(path)
+        painter.drawPolyline(QPolygonF([
+            QPointF(x - size / 2 + offset, y),
+            QPointF(x - offset, y + size / 2 - offset),
+            QPointF(x + size / 2 - offset, y - size / 2 + offset),
+        ]))
 
 
 class ThreadVisualizer(QWidget):
@@ -339,32 +501,22 @@ class ThreadVisualizer(QWidget):
         self.create_reader_section()
         self.create_writer_section()
         
-        # Timer for progress updates
-        self.progress_timer = QTimer(self)
-        self.progress_timer.timeout.connect(self.update_progress)
-        self.progress_timer.start(100)  # Update progress 10 times per second
-        
         # Progress values for active threads
         self.active_progress: Dict[tuple, float] = {}  # (type, id) -> progress
         
+        # Widgets currently waiting or active; only these are animated
+        self._animating: Set[ThreadWidget] = set()
+        
+        # Pulses (every 2nd tick, 20 FPS) and progress (every 4th tick,
+        # 10 per second) share the application's animation clock, which is
+        # only listened to while something is animating
+        self._tick_count = 0
+        self._ticking = False
+        
     def create_reader_section(self):
         """Create reader threads section."""
         reader_group = QGroupBox("Reader Threads")
-        reader_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #4CAF50;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #4CAF50;
-            }
-        """)
+        reader_group.setStyleSheet(_READER_GROUP_QSS)
         
         self.reader_layout = QHBoxLayout()
         self.reader_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
@@ -375,21 +527,7 @@ class ThreadVisualizer(QWidget):
     def create_writer_section(self):
         """Create writer threads section."""
         writer_group = QGroupBox("Writer Threads")
-        writer_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #f44336;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #f44336;
-            }
-        """)
+        writer_group.setStyleSheet(_WRITER_GROUP_QSS)
         
         self.writer_layout = QHBoxLayout()
         self.writer_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
@@ -397,8 +535,84 @@ class ThreadVisualizer(QWidget):
         writer_group.setLayout(self.writer_layout)
         self.main_layout.addWidget(writer_group)
         
+    def _on_tick(self):
+        """Advance pulse and progress animations on the shared clock."""
+        self._tick_count = (self._tick_count + 1) % 4
+        if self._tick_count % 2:
+            return
+        
+        for widget in self._animating:
+            widget.update_pulse()
+        
+        if self._tick_count == 0:
+            self.update_progress()
+    
+    def _track_animation(self, widget: ThreadWidget, status: str):
+        """Add or remove a widget from the animated set for its status."""
+        if status in ('waiting', 'active'):
+            self._animating.add(widget)
+        else:
+            self._animating.discard(widget)
+    
+    def _sync_ticking(self):
+        """Follow the animation clock only while there is work for a tick."""
+        busy = bool(self._animating or self.active_progress)
+        if busy and not self._ticking:
+            subscribe_animation(self._on_tick)
+            self._ticking = True
+        elif not busy and self._ticking:
+            unsubscribe_animation(self._on_tick)
+            self._ticking = False
+    
+    def preallocate(self, num_readers: int, num_writers: int):
+        """
+        Create hidden widgets for every thread before the simulation starts.
+        
+        Widgets of threads beyond the new counts, left from a larger earlier
+        run, are removed. Layouts are disabled while adding so the whole set
+        is laid out once, instead of once per widget as the first burst of
+        updates arrives.
+        """
+        for layout, widgets, thread_type, count in (
+                (self.reader_layout, self.reader_widgets, 'reader', num_readers),
+                (self.writer_layout, self.writer_widgets, 'writer', num_writers)):
+            layout.setEnabled(False)
+            for thread_id in [i for i in widgets if i > count]:
+                widget = widgets.pop(thread_id)
+                layout.removeWidget(widget)
+                widget.deleteLater()
+                self._animating.discard(widget)
+                self.active_progress.pop((thread_type, thread_id), None)
+            # Thread ids are numbered from 1 by the simulation
+            for thread_id in range(1, count + 1):
+                if thread_id not in widgets:
+                    widget = ThreadWidget(thread_id, thread_type)
+                    widget.hide()
+                    widgets[thread_id] = widget
+                    layout.addWidget(widget)
+            layout.setEnabled(True)
+        self._sync_ticking()
+        
+    def update_threads(self, batch: List[Dict]):
+        """
+        Apply a batch of thread updates from the simulation.
+        
+        The simulation already coalesces updates to the latest state of each
+        thread per drain (~30 Hz), and widgets ignore unchanged statuses, so
+        batches are applied directly; only the clock subscription is
+        re-checked once per batch rather than per thread.
+        """
+        for thread_data in batch:
+            self._apply_thread_update(thread_data)
+        self._sync_ticking()
+            
     def update_thread(self, thread_data: Dict):
         """Update thread status based on simulation data."""
+        self._apply_thread_update(thread_data)
+        self._sync_ticking()
+        
+    def _apply_thread_update(self, thread_data: Dict):
+        """Route one update to the reader or writer widget."""
         thread_type = thread_data['thread_type']
         thread_id = thread_data['thread_id']
         status = thread_data['status']
@@ -418,7 +632,10 @@ class ThreadVisualizer(QWidget):
             self.reader_layout.addWidget(widget)
         
         widget = self.reader_widgets[thread_id]
+        if widget.isHidden():
+            widget.show()
         widget.update_status(status, action)
+        self._track_animation(widget, status)
         
         # Update progress tracking
         key = ('reader', thread_id)
@@ -441,7 +658,10 @@ class ThreadVisualizer(QWidget):
             self.writer_layout.addWidget(widget)
         
         widget = self.writer_widgets[thread_id]
+        if widget.isHidden():
+            widget.show()
         widget.update_status(status, action)
+        self._track_animation(widget, status)
         
         # Update progress tracking
         key = ('writer', thread_id)
@@ -457,31 +677,34 @@ class ThreadVisualizer(QWidget):
                 
     def update_progress(self):
         """Update progress for active threads."""
-        # Increment progress for all active threads
-        for key in list(self.active_progress.keys()):
+        # Increment progress for all active threads; finished entries are
+        # removed after the pass instead of iterating over a key copy
+        done_keys = []
+        for key, progress in self.active_progress.items():
             thread_type, thread_id = key
             
             # Different increment rates for read vs write
             increment = 0.02 if thread_type == 'reader' else 0.01
-            
-            self.active_progress[key] += increment
+            progress += increment
             
             # Cap at 1.0
-            if self.active_progress[key] >= 1.0:
-                del self.active_progress[key]
+            if progress >= 1.0:
+                done_keys.append(key)
                 continue
+            self.active_progress[key] = progress
                 
             # Update widget
             if thread_type == 'reader':
                 if thread_id in self.reader_widgets:
-                    self.reader_widgets[thread_id].set_progress(
-                        self.active_progress[key]
-                    )
+                    self.reader_widgets[thread_id].set_progress(progress)
             else:
                 if thread_id in self.writer_widgets:
-                    self.writer_widgets[thread_id].set_progress(
-                        self.active_progress[key]
-                    )
+                    self.writer_widgets[thread_id].set_progress(progress)
+        
+        for key in done_keys:
+            del self.active_progress[key]
+        if done_keys:
+            self._sync_ticking()
                     
     def reset(self):
         """Reset the visualizer."""
@@ -497,6 +720,8 @@ class ThreadVisualizer(QWidget):
         self.writer_widgets.clear()
         
         self.active_progress.clear()
+        self._animating.clear()
+        self._sync_ticking()
 
 
 class ResourceVisualizer(QWidget):
@@ -506,19 +731,39 @@ class ResourceVisualizer(QWidget):
     Shows current access state and animation of readers/writers entering/exiting.
     """
     
+    # Most reader indicators drawn around the resource
+    MAX_INDICATORS = 12
+    
+    # Access ripple length in animation ticks (0.5 s on the 25 ms clock);
+    # its radii are rounded down to multiples of RIPPLE_BUCKET pixels
+    RIPPLE_FRAMES = 20
+    RIPPLE_BUCKET = 4
+    
+    # Initial resource and access state, applied by __init__ and reset()
+    _RESET_STATE = {
+        'reader_active': False,
+        'writer_active': False,
+        'active_count': 0,        # readers currently inside the resource
+        'access_count': 0,        # total from the lock's stats
+        'access_animation': 0,    # ripple frames left to show
+        '_access_text': "Total Accesses: 0",
+        '_last_access_type': AccessType.CONFLICT,  # before any access
+    }
+    
     def __init__(self, parent=None):
         """Initialize resource visualizer."""
         super().__init__(parent)
         
-        # Resource state
-        self.reader_active = False
-        self.writer_active = False
-        self.active_count = 0
+        # paintEvent starts by blitting an opaque background over the whole
+        # widget, so Qt need not erase it first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        
+        # Resource state and access ripple
+        self._apply_reset_state()
         
         # Animation values
-        self.pulse_value = 0
-        self.access_animation = 0
-        self.rotation_angle = 0
+        self.pulse_index = 0
         
         # Colors
         self.idle_color = QColor(200, 200, 200)
@@ -526,54 +771,180 @@ class ResourceVisualizer(QWidget):
         self.writer_color = QColor(244, 67, 54)     # Red
         self.conflict_color = QColor(255, 193, 7)   # Yellow
         
-        # Timer for animations
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self.update_animation)
-        self.animation_timer.start(30)  # ~33 FPS
+        # Dashed pens for the access ripple, indexed by AccessType
+        ripple_pens = []
+        for color in (self.writer_color, self.reader_color, self.conflict_color):
+            # Qt's DashLine pattern spelled out
+            pen = QPen(color, 3)
+            pen.setDashPattern([4, 2])
+            ripple_pens.append(pen)
+        self._ripple_pens: Tuple[QPen, ...] = tuple(ripple_pens)
+        
+        # Status line pens; None is the idle resource
+        self._status_pens = {
+            AccessType.WRITER: cached_pen(self.writer_color, 2),
+            AccessType.READER: cached_pen(self.reader_color, 2),
+            None: cached_pen(self.idle_color, 2),
+        }
+        
+        # Resource circle brushes per access state, built once
+        self._resource_brushes = {
+            'writer': _bounding_radial_brush(
+                (0, self.writer_color.lighter(200)), (0.7, self.writer_color),
+                (1, self.writer_color.darker(150))),
+            'reader': _bounding_radial_brush(
+                (0, self.reader_color.lighter(200)), (0.7, self.reader_color),
+                (1, self.reader_color.darker(150))),
+            'idle': _bounding_radial_brush(
+                (0, self.idle_color.lighter(150)), (1, self.idle_color.darker(100))),
+        }
+        
+        # Animations run on the shared clock (40 FPS), which is only
+        # listened to while the resource pulses or a ripple is fading
+        self._ticking = False
+        
+        # Fonts and their metrics, built once instead of per paint
+        self._status_font_big = QFont()
+        self._status_font_big.setBold(True)
+        self._status_font_big.setPointSize(12)
+        self._status_font_small = QFont(self._status_font_big)
+        self._status_font_small.setPointSize(10)
+        self._indicator_font = QFont(self._status_font_big)
+        self._indicator_font.setPointSize(8)
+        self._font_metrics = {
+            'big': QFontMetrics(self._status_font_big),
+            'small': QFontMetrics(self._status_font_small),
+        }
+        
+        # Text widths keyed by (font key, text)
+        self._text_advance_cache: Dict[tuple, int] = {}
         
-        # Access history
-        self.access_history = []
+        # Only the most recent activity starts are kept
+        self.access_history = deque(maxlen=64)
+        
+        # Widget centre and ripple radius per frame, kept in step with the
+        # size by resizeEvent
+        self._update_geometry()
         
         # Set size
         self.setMinimumHeight(150)
         
+    def _apply_reset_state(self):
+        """Set the attributes in _RESET_STATE to their initial values."""
+        for name, value in self._RESET_STATE.items():
+            setattr(self, name, value)
+        
     def set_reader_active(self, active: bool):
-        """Set reader active state."""
+        """Set reader active state; repeats of the current state are ignored."""
+        if active == self.reader_active:
+            return
         self.reader_active = active
         if active:
-            self.active_count += 1
-            self.access_animation = 1.0
-            self.access_history.append(('reader', self.active_count))
+            self.access_animation = self.RIPPLE_FRAMES
+            self._record_access(AccessType.READER)
+        else:
+            self.active_count = 0
+        self._sync_ticking()
         self.update()
         
     def set_writer_active(self, active: bool):
-        """Set writer active state."""
+        """Set writer active state; repeats of the current state are ignored."""
+        if active == self.writer_active:
+            return
         self.writer_active = active
         if active:
-            self.active_count += 1
-            self.access_animation = 1.0
-            self.access_history.append(('writer', self.active_count))
+            self.access_animation = self.RIPPLE_FRAMES
+            self._record_access(AccessType.WRITER)
+        self._sync_ticking()
         self.update()
         
+    def set_active_readers(self, count: int):
+        """Set the number of readers currently inside the resource."""
+        if count != self.active_count:
+            self.active_count = count
+            self.update()
+        
+    def set_access_count(self, count: int):
+        """
+        Set the total shown in the status line.
+        
+        The activity signals only fire when the resource goes from idle to
+        busy and back, so overlapping readers would count once; the total
+        comes from the lock's completed reads and writes instead.
+        """
+        if count != self.access_count:
+            self.access_count = count
+            self._access_text = f"Total Accesses: {count}"
+            self.update()
+        
+    def _record_access(self, access_type: AccessType):
+        """Remember the type of the access that started the ripple."""
+        self.access_history.append((access_type, self.access_count))
+        self._last_access_type = access_type
+        
+    def resizeEvent(self, event):
+        """Recompute the centre and ripple radii for the new size."""
+        super().resizeEvent(event)
+        self._update_geometry()
+        
+    def _update_geometry(self):
+        """Compute the widget centre and the ripple radius for each frame."""
+        width = self.width()
+        height = self.height()
+        self._center = QPointF(width // 2, height // 2)
+        reach = min(width, height) * 0.4
+        self._ripple_radii = [int(reach * frame / self.RIPPLE_FRAMES)
+                              for frame in range(self.RIPPLE_FRAMES + 1)]
+        
     def update_animation(self):
-        """Update animation values."""
+        """
+        Update animation values, repainting only what moved.
+        
+        A pulsing resource repaints the whole widget. A ripple fading over
+        an idle resource only repaints the square it covered last frame,
+        since the ring only shrinks and everything outside it is unchanged.
+        """
+        pulsing = self.reader_active or self.writer_active
+        
         # Update pulse for active state
-        if self.reader_active or self.writer_active:
-            self.pulse_value = (self.pulse_value + 0.1) % (2 * math.pi)
+        if pulsing:
+            self.pulse_index = (self.pulse_index + _PULSE_STEP) % _PULSE_STEPS
+            self.update()
             
-        # Update access animation
+        # Count down the access ripple; at zero idle frames skip it entirely
         if self.access_animation > 0:
-            self.access_animation -= 0.05
-            
-        # Update rotation for visual interest
-        self.rotation_angle = (self.rotation_angle + 1) % 360
-            
-        self.update()
+            if not pulsing:
+                # Ring radius plus its pen, before this tick shrinks it
+                reach = self._ripple_radii[self.access_animation] + 4
+                self.update(QRect(self.width() // 2 - reach,
+                                  self.height() // 2 - reach,
+                                  reach * 2, reach * 2))
+            self.access_animation -= 1
+        elif not pulsing:
+            self._sync_ticking()
+        
+    def _sync_ticking(self):
+        """Follow the animation clock only while something is animating."""
+        busy = bool(self.reader_active or self.writer_active or
+                    self.access_animation > 0)
+        if busy and not self._ticking:
+            subscribe_animation(self.update_animation)
+            self._ticking = True
+        elif not busy and self._ticking:
+            unsubscribe_animation(self.update_animation)
+            self._ticking = False
         
     def paintEvent(self, event):
-        """Paint the resource visualizer."""
+        """
+        Paint the resource visualizer.
+        
+        The draw_* helpers set every pen, brush and font they use and undo
+        any translation themselves, so no painter state is saved or restored.
+        """
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Antialias only while the resource pulses; idle frames are static
+        if self.reader_active or self.writer_active:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         width = self.width()
         height = self.height()
@@ -594,220 +965,235 @@ class ResourceVisualizer(QWidget):
         painter.end()
         
     def draw_background(self, painter: QPainter, width: int, height: int):
-        """Draw the background with gradient."""
-        gradient = QLinearGradient(0, 0, 0, height)
-        gradient.setColorAt(0, QColor(240, 240, 240))
-        gradient.setColorAt(1, QColor(220, 220, 220))
-        
-        painter.fillRect(0, 0, width, height, QBrush(gradient))
-        
-        # Draw border
-        painter.setPen(QPen(QColor(150, 150, 150), 2))
-        painter.drawRect(1, 1, width - 2, height - 2)
+        """
+        Draw the background, rendered once per size via QPixmapCache.
+        
+        The pixmap is opaque and covers the whole widget, which is what lets
+        the widget set WA_OpaquePaintEvent; it is rendered at the device pixel
+        ratio so the blit also covers every device pixel on high-DPI screens.
+        """
+        dpr = self.devicePixelRatioF()
+        key = f"resource_bg_{width}x{height}@{dpr}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(int(width * dpr), int(height * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            bg_painter = QPainter(pixmap)
+            bg_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            
+            gradient = QLinearGradient(0, 0, 0, height)
+            gradient.setColorAt(0, COLORS['background_top'])
+            gradient.setColorAt(1, COLORS['background_bottom'])
+            
+            bg_painter.fillRect(0, 0, width, height, QBrush(gradient))
+            
+            # Draw border
+            bg_painter.setPen(PENS['frame'])
+            bg_painter.drawRect(1, 1, width - 2, height - 2)
+            bg_painter.end()
+            
+            QPixmapCache.insert(key, pixmap)
+            
+        painter.drawPixmap(0, 0, pixmap)
         
     def draw_resource(self, painter: QPainter, width: int, height: int):
         """Draw the resource (database) representation."""
-        center_x = width // 2
-        center_y = height // 2
+        center = self._center
         size = min(width, height) * 0.6
         
-        # Determine current color based on access
-        if self.writer_active:
-            base_color = self.writer_color
-            status = "Writing"
-        elif self.reader_active:
-            base_color = self.reader_color
-            status = "Reading"
-        else:
-            base_color = self.idle_color
-            status = "Idle"
-            
-        # Add pulse effect if active
-        if self.reader_active or self.writer_active:
-            pulse = abs(math.sin(self.pulse_value)) * 20
-            size += pulse
-            
-            # Create animated gradient
-            gradient = QRadialGradient(center_x, center_y, size / 2)
-            if self.writer_active:
-                gradient.setColorAt(0, self.writer_color.lighter(200))
-                gradient.setColorAt(0.7, self.writer_color)
-                gradient.setColorAt(1, self.writer_color.darker(150))
-            else:
-                gradient.setColorAt(0, self.reader_color.lighter(200))
-                gradient.setColorAt(0.7, self.reader_color)
-                gradient.setColorAt(1, self.reader_color.darker(150))
-                
-            brush = QBrush(gradient)
+        reader_active = self.reader_active
+        writer_active = self.writer_active
+        brushes = self._resource_brushes
+        
+        # Pick the brush for the current access; add pulse effect if active
+        if writer_active:
+            brush = brushes['writer']
+            size += _ABS_SIN_LUT[self.pulse_index] * 20
+        elif reader_active:
+            brush = brushes['reader']
+            size += _ABS_SIN_LUT[self.pulse_index] * 20
         else:
-            # Static gradient for idle
-            gradient = QRadialGradient(center_x, center_y, size / 2)
-            gradient.setColorAt(0, base_color.lighter(150))
-            gradient.setColorAt(1, base_color.darker(100))
-            brush = QBrush(gradient)
+            brush = brushes['idle']
             
-        # Draw main resource circle
+        # Draw main resource circle; the gradient follows its bounding box
         painter.setBrush(brush)
-        painter.setPen(QPen(QColor(100, 100, 100), 3))
-        painter.drawEllipse(center_x - size / 2, center_y - size / 2, size, size)
+        painter.setPen(PENS['outline'])
+        painter.drawEllipse(center, size / 2, size / 2)
         
         # Draw database symbol
+        center_x = width // 2
+        center_y = height // 2
         self.draw_database_symbol(painter, center_x, center_y, size * 0.6)
         
         # Draw concurrent readers indicator
-        if self.reader_active and self.active_count > 1:
+        if reader_active and self.active_count > 1:
             self.draw_concurrent_indicator(painter, center_x, center_y, size)
             
     def draw_database_symbol(self, painter: QPainter, x: int, y: int, size: float):
+        """Draw the database symbol, rendered once per whole-pixel size."""
+        bucket = int(size)
+        # Logical side: room for the cylinder plus its outline pen
+        side = bucket + 4
+        dpr = self.devicePixelRatioF()
+        key = f"resource_db_{bucket}@{dpr}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(int(side * dpr), int(side * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            db_painter = QPainter(pixmap)
+            db_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self.render_database_symbol(db_painter, side // 2, side // 2, bucket)
+            db_painter.end()
+            
+            QPixmapCache.insert(key, pixmap)
+        
+        # Centre by logical size; pixmap.width() is in device pixels
+        painter.drawPixmap(x - side // 2, y - side // 2, pixmap)
+        
+    def render_database_symbol(self, painter: QPainter, x: int, y: int, size: float):
         """Draw database symbol (cylinder with lines)."""
         cylinder_height = size * 0.8
         cylinder_width = size * 0.6
         
-        # Save painter state
-        painter.save()
-        
         # Draw cylinder body
-        painter.setBrush(QBrush(QColor(255, 255, 255, 200)))
-        painter.setPen(QPen(QColor(100, 100, 100), 2))
-        
-        # Draw oval top
-        painter.drawEllipse(int(x - cylinder_width / 2), 
-                          int(y - cylinder_height / 2), 
-                          int(cylinder_width), int(cylinder_height / 3))
-        
-        # Draw sides
-        left_x = x - cylinder_width / 2
-        right_x = x + cylinder_width / 2
-        top_y = y - cylinder_height / 2 + cylinder_height / 6
-        bottom_y = y + cylinder_height / 2
-        
-        painter.drawLine(int(left_x), int(top_y), int(left_x), int(bottom_y))
-        painter.drawLine(int(right_x), int(top_y), int(right_x), int(bottom_y))
-        
-        # Draw bottom oval
-        painter.drawEllipse(int(x - cylinder_width / 2), 
-                          int(bottom_y - cylinder_height / 6), 
-                          int(cylinder_width), int(cylinder_height / 3))
+        painter.setBrush(PALETTE['translucent_white'])
+        painter.setPen(PENS['outline_thin'])
+        
+        # Geometry in floating point, relative to the symbol centre
+        painter.translate(x, y)
+        left_x = -cylinder_width / 2
+        right_x = cylinder_width / 2
+        top_y = -cylinder_height / 2 + cylinder_height / 6
+        bottom_y = cylinder_height / 2
+        oval_height = cylinder_height / 3
+        
+        # Draw oval top, sides and bottom oval
+        painter.drawEllipse(QRectF(left_x, -cylinder_height / 2,
+                                   cylinder_width, oval_height))
+        painter.drawLine(QLineF(left_x, top_y, left_x, bottom_y))
+        painter.drawLine(QLineF(right_x, top_y, right_x, bottom_y))
+        painter.drawEllipse(QRectF(left_x, bottom_y - cylinder_height / 6,
+                                   cylinder_width, oval_height))
         
         # Draw data lines inside
-        painter.setPen(QPen(QColor(70, 130, 180), 1))
+        painter.setPen(PENS['data_line'])
         line_spacing = cylinder_height / 6
         for i in range(1, 4):
             line_y = top_y + i * line_spacing
-            painter.drawLine(int(left_x + 5), int(line_y), 
-                           int(right_x - 5), int(line_y))
-            
-        # Restore painter
-        painter.restore()
+            painter.drawLine(QLineF(left_x + 5, line_y, right_x - 5, line_y))
         
     def draw_concurrent_indicator(self, painter: QPainter, x: int, y: int, size: float):
         """Draw indicator for concurrent readers."""
         indicator_radius = size * 0.15
-        angle_step = 2 * math.pi / self.active_count
+        orbit = size * 0.4
         
-        painter.save()
-        painter.setBrush(QBrush(QColor(255, 255, 255, 200)))
-        painter.setPen(QPen(QColor(76, 175, 80), 2))
+        painter.translate(x, y)
+        painter.setBrush(PALETTE['translucent_white'])
+        painter.setPen(PENS['concurrent_reader'])
+        painter.setFont(self._indicator_font)
         
-        for i in range(self.active_count):
-            angle = i * angle_step
-            indicator_x = x + (size * 0.4) * math.cos(angle)
-            indicator_y = y + (size * 0.4) * math.sin(angle)
-            
-            painter.drawEllipse(int(indicator_x - indicator_radius),
-                              int(indicator_y - indicator_radius),
-                              int(indicator_radius * 2),
-                              int(indicator_radius * 2))
-                              
-            # Draw "R" inside
-            painter.setPen(QPen(QColor(76, 175, 80), 2))
-            font = QFont()
-            font.setBold(True)
-            font.setPointSize(8)
-            painter.setFont(font)
-            painter.drawText(int(indicator_x - 5), int(indicator_y + 5), "R")
-            
-        painter.restore()
+        shown = min(self.active_count, self.MAX_INDICATORS)
+        centers = [QPointF(orbit * cos_a, orbit * sin_a)
+                   for cos_a, sin_a in _unit_circle(shown)]
+        
+        # All circles first, then all labels, so like draws run back to back
+        for center in centers:
+            painter.drawEllipse(center, indicator_radius, indicator_radius)
+        label_offset = QPointF(-5, 5)
+        for center in centers:
+            painter.drawText(center + label_offset, "R")
+        
+        # Readers beyond the ring are summarised rather than drawn
+        hidden = self.active_count - shown
+        if hidden > 0:
+            painter.drawText(QPointF(-10, orbit + indicator_radius + 12),
+                             f"+{hidden}")
+        
+        painter.translate(-x, -y)
         
     def draw_status(self, painter: QPainter, width: int, height: int):
         """Draw status text."""
-        painter.save()
-        
         # Determine status text
         if self.writer_active:
             status_text = "WRITER ACTIVE (Exclusive Access)"
-            color = self.writer_color
+            pen = self._status_pens[AccessType.WRITER]
         elif self.reader_active:
             if self.active_count > 1:
                 status_text = f"{self.active_count} READERS ACTIVE (Concurrent)"
             else:
                 status_text = "READER ACTIVE"
-            color = self.reader_color
+            pen = self._status_pens[AccessType.READER]
         else:
             status_text = "RESOURCE AVAILABLE"
-            color = self.idle_color
+            pen = self._status_pens[None]
             
         # Draw status
-        font = QFont()
-        font.setBold(True)
-        font.setPointSize(12)
-        painter.setFont(font)
-        painter.setPen(QPen(color, 2))
+        painter.setFont(self._status_font_big)
+        painter.setPen(pen)
         
-        text_width = painter.fontMetrics().horizontalAdvance(status_text)
+        text_width = self.cached_advance('big', status_text)
         painter.drawText(width // 2 - text_width // 2, 30, status_text)
         
         # Draw access count
-        access_text = f"Total Accesses: {len(self.access_history)}"
-        font.setPointSize(10)
-        painter.setFont(font)
-        painter.setPen(QPen(QColor(100, 100, 100), 1))
+        access_text = self._access_text
+        painter.setFont(self._status_font_small)
+        painter.setPen(PENS['caption'])
         
-        text_width = painter.fontMetrics().horizontalAdvance(access_text)
+        text_width = self.cached_advance('small', access_text)
         painter.drawText(width // 2 - text_width // 2, height - 10, access_text)
         
-        painter.restore()
+    def cached_advance(self, font_key: str, text: str) -> int:
+        """Width of text in one of the status fonts, measured once per string."""
+        key = (font_key, text)
+        advance = self._text_advance_cache.get(key)
+        if advance is None:
+            # The access count keeps producing new strings; stay bounded
+            if len(self._text_advance_cache) >= 256:
+                self._text_advance_cache.clear()
+            advance = self._font_metrics[font_key].horizontalAdvance(text)
+            self._text_advance_cache[key] = advance
+        return advance
         
     def draw_access_animation(self, painter: QPainter, width: int, height: int):
         """Draw animation for new access."""
         if self.access_animation <= 0:
             return
             
-        painter.save()
-        
-        center_x = width // 2
-        center_y = height // 2
-        max_radius = min(width, height) * 0.8
-        
-        # Calculate current radius based on animation progress
-        radius = max_radius * self.access_animation
-        
-        # Set pen based on last access type
-        if self.access_history:
-            last_type, _ = self.access_history[-1]
-            if last_type == 'writer':
-                color = self.writer_color
-            else:
-                color = self.reader_color
-        else:
-            color = self.conflict_color
+        # Current radius from the per-frame table, rounded to a bucket so
+        # each dashed ring is stroked once and then blitted
+        radius = self._ripple_radii[self.access_animation]
+        bucket = max(1, radius // self.RIPPLE_BUCKET * self.RIPPLE_BUCKET)
+        dpr = self.devicePixelRatioF()
+        key = f"resource_ripple_{int(self._last_access_type)}_{bucket}@{dpr}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            # Room for the ring plus its 3 px pen
+            side = 2 * bucket + 4
+            pixmap = QPixmap(int(side * dpr), int(side * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            ring_painter = QPainter(pixmap)
+            ring_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            ring_painter.setPen(self._ripple_pens[self._last_access_type])
+            ring_painter.setBrush(PALETTE['none'])
+            ring_painter.drawEllipse(QPointF(side / 2, side / 2), bucket, bucket)
+            ring_painter.end()
             
-        pen = QPen(color, 3)
-        pen.setStyle(Qt.PenStyle.DashLine)
-        painter.setPen(pen)
-        painter.setBrush(Qt.BrushStyle.NoBrush)
+            QPixmapCache.insert(key, pixmap)
         
-        # Draw expanding circle
-        painter.drawEllipse(int(center_x - radius / 2),
-                          int(center_y - radius / 2),
-                          int(radius), int(radius))
-                          
-        painter.restore()
+        # Blit the ring centred on the resource at a whole-pixel position,
+        # which keeps the blit an unscaled copy even with antialiasing on
+        offset = bucket + 2
+        painter.drawPixmap(width // 2 - offset, height // 2 - offset, pixmap)
         
     def reset(self):
-        """Reset the resource visualizer."""
-        self.reader_active = False
-        self.writer_active = False
-        self.active_count = 0
+        """Reset the resource visualizer; a no-op if it is already reset."""
+        if not (self.reader_active or self.writer_active or self.active_count
+                or self.access_count or self.access_animation):
+            return
+        
+        self._apply_reset_state()
         self.access_history.clear()
+        self._sync_ticking()
         self.update()
\ No newline at end of file
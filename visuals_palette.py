@@ -0,0 +1,49 @@
+"""
+Shared palette for the visualization widgets
+Pre-built colors, brushes and pens so paint code does not construct them per frame
+"""
+from typing import Dict, Tuple
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QBrush, QPen
+
+
+# Named colors used by the visualizers
+COLORS: Dict[str, QColor] = {
+    'white': QColor(255, 255, 255),
+    'progress_start': QColor(76, 175, 80),
+    'progress_end': QColor(56, 142, 60),
+    'background_top': QColor(240, 240, 240),
+    'background_bottom': QColor(220, 220, 220),
+}
+
+# Solid brushes
+PALETTE: Dict[str, QBrush] = {
+    'progress_track': QBrush(QColor(200, 200, 200, 150)),
+    'translucent_white': QBrush(QColor(255, 255, 255, 200)),
+    'none': QBrush(Qt.BrushStyle.NoBrush),
+}
+
+# Pens with fixed color and width
+PENS: Dict[str, QPen] = {
+    'icon': QPen(Qt.GlobalColor.white, 2),
+    'icon_thick': QPen(Qt.GlobalColor.white, 3),
+    'frame': QPen(QColor(150, 150, 150), 2),
+    'outline': QPen(QColor(100, 100, 100), 3),
+    'outline_thin': QPen(QColor(100, 100, 100), 2),
+    'caption': QPen(QColor(100, 100, 100), 1),
+    'data_line': QPen(QColor(70, 130, 180), 1),
+    'concurrent_reader': QPen(QColor(76, 175, 80), 2),
+}
+
+# Pens for colors only known at paint time, keyed by (rgba, width)
+_pen_cache: Dict[Tuple[int, int], QPen] = {}
+
+
+def cached_pen(color: QColor, width: int = 1) -> QPen:
+    """Return a shared solid pen for the given color and width."""
+    key = (color.rgba(), width)
+    pen = _pen_cache.get(key)
+    if pen is None:
+        pen = _pen_cache[key] = QPen(color, width)
+    return pen